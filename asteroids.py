@@ -12,7 +12,7 @@ import math
 
 # Import shared modules and constants.
 from config import BLACK, WHITE, BLUE
-from utils import draw_text, pause_menu, settings_menu, Particle, create_explosion
+from utils import draw_text, pause_menu, settings_menu, Particle, create_explosion, get_font
 import scores
 
 # --- Initialization ---
@@ -274,7 +274,7 @@ def game_loop(screen, clock, font):
         int: The final score of the player.
     """
     pygame.display.set_caption("Asteroids")
-    font = pygame.font.Font(None, 36)
+    font = get_font(36)
     # Initialize game objects.
     player = Player()
     bullets, asteroids = [], [Asteroid() for _ in range(ASTEROID_INITIAL_COUNT)]
@@ -395,8 +395,8 @@ def run_game(screen, clock):
         screen (pygame.Surface): The main screen surface.
         clock (pygame.time.Clock): The Pygame clock object.
     """
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 36)
+    font = get_font(74)
+    small_font = get_font(36)
     # Main state machine loop.
     while True:
         menu_choice = main_menu(screen, clock, font, small_font)
@@ -426,8 +426,8 @@ def end_screen(screen, clock, font, message):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    title_font = pygame.font.Font(None, 60)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(60)
+    button_font = get_font(40)
 
     # Main loop for the end screen.
     while True:
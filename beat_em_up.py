@@ -7,7 +7,7 @@ import sys
 import random
 
 from config import BLACK, WHITE, RED, GREEN, BLUE, YELLOW
-from utils import draw_text
+from utils import draw_text, get_font
 
 # --- Game Constants ---
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
@@ -226,8 +226,8 @@ def run_game(screen, clock):
         'punch': pygame.K_k, 'kick': pygame.K_l
     }, facing_left=True)
 
-    font = pygame.font.Font(None, 40)
-    small_font = pygame.font.Font(None, 24)
+    font = get_font(40)
+    small_font = get_font(24)
     game_over = False
 
     while not game_over:
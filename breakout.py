@@ -11,7 +11,7 @@ import random
 
 # Import shared modules and constants.
 from config import BLACK, WHITE, GREEN, BLUE
-from utils import draw_text, pause_menu, settings_menu, Particle, create_explosion
+from utils import draw_text, pause_menu, settings_menu, Particle, create_explosion, get_font
 import scores
 
 # --- Initialization ---
@@ -84,7 +84,7 @@ class PowerUp:
             screen (pygame.Surface): The screen to draw on.
         """
         pygame.draw.rect(screen, self.color, self.rect)
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         text = font.render(self.type, True, WHITE)
         screen.blit(text, text.get_rect(center=self.rect.center))
 
@@ -209,7 +209,7 @@ def game_loop(screen, clock, font, level, total_score=0):
         tuple: (score, status) where status is 'next_level', 'game_over', or 'quit'.
     """
     pygame.display.set_caption(f"Breakout - Level {level}")
-    font = pygame.font.Font(None, 36)
+    font = get_font(36)
     # Initialize game objects.
     paddle = pygame.Rect(SCREEN_WIDTH / 2 - PADDLE_WIDTH / 2, SCREEN_HEIGHT - 40, PADDLE_WIDTH, PADDLE_HEIGHT)
     balls = [pygame.Rect(SCREEN_WIDTH / 2 - BALL_RADIUS, paddle.y - BALL_RADIUS * 2, BALL_RADIUS * 2, BALL_RADIUS * 2)]
@@ -394,8 +394,8 @@ def end_screen(screen, clock, font, message):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    title_font = pygame.font.Font(None, 60)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(60)
+    button_font = get_font(40)
 
     # Main loop for the end screen.
     while True:
@@ -457,9 +457,9 @@ def congratulations_screen(screen, clock, font, final_score):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    title_font = pygame.font.Font(None, 70)
-    score_font = pygame.font.Font(None, 50)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(70)
+    score_font = get_font(50)
+    button_font = get_font(40)
 
     while True:
         screen.fill(BACKGROUND_COLOR)
@@ -508,8 +508,8 @@ def run_game(screen, clock):
         screen (pygame.Surface): The main screen surface.
         clock (pygame.time.Clock): The Pygame clock object.
     """
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 36)
+    font = get_font(74)
+    small_font = get_font(36)
     
     # Game loop for levels
     while True:
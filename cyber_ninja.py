@@ -17,7 +17,7 @@ STAR_SPEED = 0.5
 
 # Import shared modules and constants
 from config import BLACK, WHITE, RED, GREEN, BLUE, YELLOW
-from utils import draw_text, pause_menu, settings_menu
+from utils import draw_text, pause_menu, settings_menu, get_font
 import scores
 
 # --- Game Constants ---
@@ -524,12 +524,12 @@ def run_game(screen, clock):
             screen.blit(sprite.image, sprite.rect.topleft - camera_offset)
 
         # Draw HUD
-        draw_text(f"Health: {player.health}", pygame.font.Font(None, 36), WHITE, screen, 100, 30)
-        draw_text(f"Score: {player.score}", pygame.font.Font(None, 36), WHITE, screen, 100, 60)
+        draw_text(f"Health: {player.health}", get_font(36), WHITE, screen, 100, 30)
+        draw_text(f"Score: {player.score}", get_font(36), WHITE, screen, 100, 60)
 
         # Performance Metrics
         fps = clock.get_fps()
-        draw_text(f"FPS: {fps:.2f}", pygame.font.Font(None, 24), WHITE, screen, SCREEN_WIDTH - 150, 20)
+        draw_text(f"FPS: {fps:.2f}", get_font(24), WHITE, screen, SCREEN_WIDTH - 150, 20)
 
         pygame.display.flip()
         clock.tick(120)
@@ -7,7 +7,7 @@ import sys
 import random
 
 from config import BLACK, WHITE, GREEN, GRAY, BLUE, RED
-from utils import draw_text, pause_menu, settings_menu
+from utils import draw_text, pause_menu, settings_menu, get_font
 import scores
 
 # --- Initialization ---
@@ -418,9 +418,9 @@ def congratulations_screen(screen, clock, font, final_score):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    title_font = pygame.font.Font(None, 70)
-    score_font = pygame.font.Font(None, 50)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(70)
+    score_font = get_font(50)
+    button_font = get_font(40)
 
     while True:
         screen.fill(BACKGROUND_COLOR)
@@ -482,8 +482,8 @@ def end_screen(screen, clock, font, message):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    title_font = pygame.font.Font(None, 60)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(60)
+    button_font = get_font(40)
 
     while True:
         screen.fill(BACKGROUND_COLOR)
@@ -533,8 +533,8 @@ def run_game(screen, clock):
         screen (pygame.Surface): The main screen surface.
         clock (pygame.time.Clock): The Pygame clock object.
     """
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 36)
+    font = get_font(74)
+    small_font = get_font(36)
 
     while True:
         menu_choice = main_menu(screen, clock, font, small_font)
@@ -8,7 +8,7 @@ import random
 import math
 
 from config import BLACK, WHITE, RED, GREEN, BLUE, YELLOW
-from utils import draw_text, pause_menu, settings_menu, Particle, create_explosion
+from utils import draw_text, render_text, pause_menu, settings_menu, Particle, create_explosion, update_particles, get_particle_sprite, get_font
 import scores
 
 # --- Initialization ---
@@ -25,6 +25,8 @@ PLAYER_MAX_BULLETS = 2
 ENEMY_SIZE = 40
 ENEMY_BULLET_SPEED = 7
 
+STAR_COLOR = (150, 150, 150)
+
 # --- Game State Enums ---
 class EnemyState:
     ENTERING = 1
@@ -38,6 +40,44 @@ class EnemyType:
     DRONE = 1
     BOSS = 2
 
+# --- Asset Creation ---
+def create_ship_surface(with_cockpit=True):
+    """Creates the player's fighter surface."""
+    surface = pygame.Surface((PLAYER_SIZE, PLAYER_SIZE), pygame.SRCALPHA)
+    pygame.draw.polygon(surface, WHITE, [(PLAYER_SIZE / 2, 0), (0, PLAYER_SIZE), (PLAYER_SIZE, PLAYER_SIZE)])
+    if with_cockpit:
+        pygame.draw.rect(surface, RED, (PLAYER_SIZE / 2 - 5, PLAYER_SIZE / 2, 10, 15))
+    return surface
+
+def create_boss_surface(color):
+    """Creates a boss enemy surface in the given color."""
+    surface = pygame.Surface((ENEMY_SIZE, ENEMY_SIZE), pygame.SRCALPHA)
+    pygame.draw.polygon(surface, color, [(0, 0), (ENEMY_SIZE, 0), (ENEMY_SIZE / 2, ENEMY_SIZE)])
+    return surface
+
+def create_drone_surface():
+    """Creates a drone enemy surface."""
+    surface = pygame.Surface((ENEMY_SIZE, ENEMY_SIZE), pygame.SRCALPHA)
+    pygame.draw.polygon(surface, (0, 255, 255), [(ENEMY_SIZE / 2, 0), (0, ENEMY_SIZE - 10), (ENEMY_SIZE, ENEMY_SIZE - 10)])
+    return surface
+
+def create_bullet_surface(color):
+    """Creates a bullet surface in the given color."""
+    surface = pygame.Surface((4, 15))
+    surface.fill(color)
+    return surface
+
+class Assets:
+    def __init__(self):
+        self.ship = create_ship_surface()
+        self.life_icon = create_ship_surface(with_cockpit=False)
+        self.boss = create_boss_surface((255, 0, 255))
+        self.boss_damaged = create_boss_surface((255, 128, 255))
+        self.drone = create_drone_surface()
+        self.bullets = {WHITE: create_bullet_surface(WHITE), YELLOW: create_bullet_surface(YELLOW)}
+
+assets = Assets()
+
 # --- Helper Functions ---
 def create_starfield(num_stars):
     """Creates a list of stars for the background."""
@@ -45,12 +85,74 @@ def create_starfield(num_stars):
 
 def draw_starfield(screen, stars):
     """Draws and updates the starfield."""
+    # A radius-1 circle is a 2x2 block; a rect fill draws the same pixels without the circle rasterizer.
+    fill = screen.fill
     for star in stars:
         star['y'] += star['speed']
         if star['y'] > SCREEN_HEIGHT:
             star['y'] = 0
             star['x'] = random.randint(0, SCREEN_WIDTH)
-        pygame.draw.circle(screen, (150, 150, 150), (int(star['x']), int(star['y'])), 1)
+        fill(STAR_COLOR, (int(star['x']) - 1, int(star['y']) - 1, 2, 2))
+
+# Bullets and particles that left play are kept here and reused instead of reallocated.
+bullet_pool = []
+particle_pool = []
+
+def spawn_bullet(bullets, x, y, speed, color):
+    """Adds a bullet to `bullets`, recycling one from the pool when available."""
+    if bullet_pool:
+        bullet = bullet_pool.pop()
+        bullet.rect.topleft = (x - 2, y)
+        bullet.speed = speed
+        bullet.color = color
+        bullet.sprite = assets.bullets[color]
+    else:
+        bullet = Bullet(x, y, speed, color)
+    bullets.append(bullet)
+
+def remove_bullet(bullets, bullet):
+    """Removes a bullet from play and returns it to the pool."""
+    if bullet in bullets:
+        bullets.remove(bullet)
+        bullet_pool.append(bullet)
+
+def update_bullets(bullets, screen_rect):
+    """Advances every bullet in one pass and keeps only those still on screen."""
+    on_screen = screen_rect.colliderect
+    alive = []
+    for bullet in bullets:
+        bullet.rect.y += bullet.speed
+        (alive if on_screen(bullet.rect) else bullet_pool).append(bullet)
+    bullets[:] = alive
+
+def draw_sprites(screen, groups):
+    """Draws every entity in `groups` with one batched blit, in group order."""
+    screen.blits([(item.sprite, item.rect) for group in groups for item in group], doreturn=False)
+
+def draw_enemies(screen, enemies, now):
+    """
+    Draws the enemies with batched blits, each active tractor beam straight after its boss.
+
+    A beam covers the enemies drawn before it and sits under those drawn after it, so the batch
+    is flushed whenever a boss is using its beam.
+    """
+    draws = []
+    for enemy in enemies:
+        draws.append((enemy.sprite, enemy.rect))
+        if enemy.tractor_beam_active:
+            screen.blits(draws, doreturn=False)
+            draws = []
+            enemy.draw_tractor_beam(screen, now)
+    screen.blits(draws, doreturn=False)
+
+def draw_particles(screen, particles):
+    """Draws every live particle from its pre-rendered circle with one batched blit."""
+    draws = []
+    for p in particles:
+        radius = int(p.size)
+        if p.life > 0 and radius > 0:
+            draws.append((get_particle_sprite(p.color, radius), (int(p.x) - radius, int(p.y) - radius)))
+    screen.blits(draws, doreturn=False)
 
 # --- Classes ---
 class Player:
@@ -82,11 +184,11 @@ class Player:
             self.draw_single_ship(screen, self.rect.x, self.rect.y)
 
     def draw_single_ship(self, screen, x, y):
-        body_rect = pygame.Rect(x, y, PLAYER_SIZE, PLAYER_SIZE)
-        pygame.draw.polygon(screen, WHITE, [(body_rect.centerx, body_rect.top), (body_rect.left, body_rect.bottom), (body_rect.right, body_rect.bottom)])
-        pygame.draw.rect(screen, RED, (body_rect.centerx - 5, body_rect.centery, 10, 15))
+        screen.blit(assets.ship, (x, y))
 
 class CapturedFighter:
+    sprite = assets.ship
+
     def __init__(self, boss):
         self.boss = boss
         self.rect = pygame.Rect(0, 0, PLAYER_SIZE, PLAYER_SIZE)
@@ -112,20 +214,14 @@ class CapturedFighter:
         self.rescue_path = [ (start_pos[0] + (end_pos[0] - start_pos[0]) * t, start_pos[1] + (end_pos[1] - start_pos[1]) * t) for t in [i/30 for i in range(31)]]
         self.rescue_step = 0
 
-    def draw(self, screen):
-        Player.draw_single_ship(self, screen, self.rect.x, self.rect.y)
-
 class Bullet:
+    __slots__ = ('rect', 'speed', 'color', 'sprite')
+
     def __init__(self, x, y, speed, color):
         self.rect = pygame.Rect(x - 2, y, 4, 15)
         self.speed = speed
         self.color = color
-
-    def update(self):
-        self.rect.y += self.speed
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.color, self.rect)
+        self.sprite = assets.bullets[color]
 
 class Enemy:
     def __init__(self, enemy_type, formation_pos=None):
@@ -139,6 +235,12 @@ class Enemy:
         self.tractor_beam_active = False
         self.tractor_beam_timer = 0
         self.captured_ship = None
+        self.formation = None
+
+    def set_state(self, state):
+        if self.formation:
+            self.formation.notify_state_change(self.state, state)
+        self.state = state
 
     def set_path(self, path):
         self.path = path
@@ -146,25 +248,25 @@ class Enemy:
         if self.path:
             self.rect.center = self.path[0]
 
-    def update(self, player_pos):
+    def update(self, player_pos, now):
         if self.path and self.path_step < len(self.path):
             self.rect.center = self.path[self.path_step]
             self.path_step += 1
         else:
             if self.state == EnemyState.ENTERING:
-                self.state = EnemyState.FORMATION
+                self.set_state(EnemyState.FORMATION)
                 self.rect.center = self.formation_pos
             elif self.state == EnemyState.DIVING or self.state == EnemyState.CHALLENGE_FLIGHT:
-                self.state = EnemyState.REFORMING
+                self.set_state(EnemyState.REFORMING)
 
         if self.state == EnemyState.FORMATION:
-            self.rect.centerx = self.formation_pos[0] + math.sin(pygame.time.get_ticks() / 500) * 10
-            self.rect.centery = self.formation_pos[1] + math.cos(pygame.time.get_ticks() / 500) * 5
+            self.rect.centerx = self.formation_pos[0] + math.sin(now / 500) * 10
+            self.rect.centery = self.formation_pos[1] + math.cos(now / 500) * 5
         elif self.state == EnemyState.TRACTOR_BEAM:
             self.tractor_beam_timer -= 1
             if self.tractor_beam_timer <= 0:
                 self.tractor_beam_active = False
-                self.state = EnemyState.DIVING
+                self.set_state(EnemyState.DIVING)
                 self.path = self.generate_bezier_curve(self.rect.center, self.rect.center, (random.randint(0, SCREEN_WIDTH), SCREEN_HEIGHT + 50), (random.randint(0, SCREEN_WIDTH), SCREEN_HEIGHT + 50), 100)
                 self.path_step = 0
         elif self.state == EnemyState.REFORMING:
@@ -172,20 +274,20 @@ class Enemy:
             dx, dy = target_x - self.rect.centerx, target_y - self.rect.centery
             dist = math.hypot(dx, dy)
             if dist < 5:
-                self.state = EnemyState.FORMATION
+                self.set_state(EnemyState.FORMATION)
             else:
                 self.rect.x += (dx / dist) * 4
                 self.rect.y += (dy / dist) * 4
 
     def start_dive(self, player_pos):
         if self.type == EnemyType.BOSS and random.random() < 0.3:
-            self.state = EnemyState.TRACTOR_BEAM
+            self.set_state(EnemyState.TRACTOR_BEAM)
             self.tractor_beam_active = True
             self.tractor_beam_timer = 180
             start_pos, end_pos = self.rect.center, (self.rect.centerx, SCREEN_HEIGHT / 2)
             self.path = self.generate_bezier_curve(start_pos, start_pos, end_pos, end_pos, 30)
         else:
-            self.state = EnemyState.DIVING
+            self.set_state(EnemyState.DIVING)
             start_pos = self.rect.center
             control_1 = (random.randint(0, SCREEN_WIDTH), start_pos[1] + 100)
             control_2 = (player_pos[0] + random.randint(-100, 100), player_pos[1] - 100)
@@ -193,7 +295,8 @@ class Enemy:
             self.path = self.generate_bezier_curve(start_pos, control_1, control_2, end_pos, 100)
         self.path_step = 0
 
-    def generate_bezier_curve(self, p0, p1, p2, p3, num_points):
+    @staticmethod
+    def generate_bezier_curve(p0, p1, p2, p3, num_points):
         points = []
         for i in range(num_points):
             t = i / (num_points - 1) if num_points > 1 else 0
@@ -202,44 +305,45 @@ class Enemy:
             points.append((x, y))
         return points
 
-    def draw(self, screen):
+    @property
+    def sprite(self):
         if self.type == EnemyType.BOSS:
-            color = (255, 0, 255)
-            if self.health == 1: color = (255, 128, 255)
-            pygame.draw.polygon(screen, color, [(self.rect.left, self.rect.top), (self.rect.right, self.rect.top), (self.rect.centerx, self.rect.bottom)])
-        else:
-            color = (0, 255, 255)
-            pygame.draw.polygon(screen, color, [(self.rect.centerx, self.rect.top), (self.rect.left, self.rect.bottom - 10), (self.rect.right, self.rect.bottom - 10)])
-        if self.tractor_beam_active:
-            self.draw_tractor_beam(screen)
+            return assets.boss_damaged if self.health == 1 else assets.boss
+        return assets.drone
 
-    def draw_tractor_beam(self, screen):
+    def draw_tractor_beam(self, screen, now):
         beam_width, beam_height = 100, SCREEN_HEIGHT - self.rect.bottom
-        alpha = 100 + math.sin(pygame.time.get_ticks() * 0.02) * 50
+        alpha = 100 + math.sin(now * 0.02) * 50
         beam_surface = pygame.Surface((beam_width, beam_height), pygame.SRCALPHA)
         pygame.draw.polygon(beam_surface, (100, 200, 255, alpha), [(0,0), (beam_width, 0), (beam_width*0.75, beam_height), (beam_width*0.25, beam_height)])
         screen.blit(beam_surface, (self.rect.centerx - beam_width / 2, self.rect.bottom))
 
     def shoot(self, bullets):
         if self.state == EnemyState.DIVING and random.random() < 0.02:
-            bullets.append(Bullet(self.rect.centerx, self.rect.bottom, ENEMY_BULLET_SPEED, YELLOW))
+            spawn_bullet(bullets, self.rect.centerx, self.rect.bottom, ENEMY_BULLET_SPEED, YELLOW)
 
 class Formation:
     def __init__(self):
         self.enemies = []
         self.formation_positions = self.create_formation_positions()
+        # Running counts of enemies in the states the frame loop polls, kept in step by set_state.
+        self.n_entering = 0
+        self.n_formation = 0
 
     def create_formation_positions(self):
         return [(150 + col * 50, 50 + row * 50) for row in range(5) for col in range(10)]
 
     def create_wave(self, wave_num):
         self.enemies = []
+        self.n_entering = self.n_formation = 0
         num_drones, num_bosses = min(20 + wave_num * 2, 40), min(4 + wave_num, 10)
         enemy_specs = [(EnemyType.BOSS, pos) for pos in self.formation_positions[:num_bosses]] + [(EnemyType.DRONE, pos) for pos in self.formation_positions[num_bosses:num_bosses + num_drones]]
         random.shuffle(enemy_specs)
         for i, (enemy_type, pos) in enumerate(enemy_specs):
             enemy = Enemy(enemy_type, pos)
+            enemy.formation = self
             self.enemies.append(enemy)
+            self.n_entering += 1
             self.assign_entry_path(enemy, i)
 
     def assign_entry_path(self, enemy, index):
@@ -256,17 +360,25 @@ class Formation:
         path = enemy.generate_bezier_curve(start_pos, control_1, control_2, end_pos, 120)
         enemy.set_path(path)
 
-    def update(self, player_pos):
-        if all(e.state == EnemyState.FORMATION for e in self.enemies) and random.random() < 0.01:
+    def notify_state_change(self, old_state, new_state):
+        if old_state == EnemyState.ENTERING: self.n_entering -= 1
+        elif old_state == EnemyState.FORMATION: self.n_formation -= 1
+        if new_state == EnemyState.ENTERING: self.n_entering += 1
+        elif new_state == EnemyState.FORMATION: self.n_formation += 1
+
+    def remove_enemy(self, enemy):
+        self.enemies.remove(enemy)
+        self.notify_state_change(enemy.state, None)
+        enemy.formation = None
+
+    def update(self, player_pos, now):
+        if self.n_formation == len(self.enemies) and random.random() < 0.01:
             dive_candidates = [e for e in self.enemies if e.state == EnemyState.FORMATION]
             if dive_candidates: random.choice(dive_candidates).start_dive(player_pos)
-        for enemy in self.enemies: enemy.update(player_pos)
-
-    def draw(self, screen):
-        for enemy in self.enemies: enemy.draw(screen)
+        for enemy in self.enemies: enemy.update(player_pos, now)
 
     def all_enemies_entered(self):
-        return all(e.state != EnemyState.ENTERING for e in self.enemies)
+        return self.n_entering == 0
 
 def game_loop(screen, clock, font, level, player, captured_fighters):
     pygame.display.set_caption(f"Galaga - Level {level}")
@@ -275,8 +387,17 @@ def game_loop(screen, clock, font, level, player, captured_fighters):
     formation.create_wave(level)
     wave_intro_timer, respawn_timer = pygame.time.get_ticks(), 0
 
+    # Static HUD text is rendered once; the score is only re-rendered when it changes.
+    level_text = render_text(f"Level: {level}", font, WHITE, SCREEN_WIDTH / 2, 20)
+    stage_text = render_text(f"STAGE {level}", font, BLUE, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+    ready_text = render_text("GET READY!", font, YELLOW, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+    shown_score, score_text = None, None
+    screen_rect = screen.get_rect()
+
     running = True
     while running:
+        # Sample the clock once per frame and hand it to everything that animates.
+        now = pygame.time.get_ticks()
         for event in pygame.event.get():
             if event.type == pygame.QUIT: return player.score, 'quit'
             if event.type == pygame.KEYDOWN:
@@ -284,7 +405,7 @@ def game_loop(screen, clock, font, level, player, captured_fighters):
                     if len(player_bullets) < (PLAYER_MAX_BULLETS * (2 if player.dual_fighter else 1)):
                         bullets_to_fire = [player.rect.centerx] if not player.dual_fighter else [player.rect.centerx - PLAYER_SIZE, player.rect.centerx]
                         for x_pos in bullets_to_fire:
-                            player_bullets.append(Bullet(x_pos, player.rect.top, -PLAYER_BULLET_SPEED, WHITE))
+                            spawn_bullet(player_bullets, x_pos, player.rect.top, -PLAYER_BULLET_SPEED, WHITE)
                 if event.key == pygame.K_p:
                     if pause_menu(screen, clock, SCREEN_WIDTH, SCREEN_HEIGHT) == 'quit': return player.score, 'quit'
 
@@ -293,13 +414,11 @@ def game_loop(screen, clock, font, level, player, captured_fighters):
             if keys[pygame.K_LEFT]: player.move(-PLAYER_SPEED)
             if keys[pygame.K_RIGHT]: player.move(PLAYER_SPEED)
 
-        for group in [player_bullets, enemy_bullets, particles]:
-            for item in group[:]:
-                item.update()
-                if hasattr(item, 'rect') and not screen.get_rect().colliderect(item.rect): group.remove(item)
-                elif hasattr(item, 'life') and item.life <= 0: group.remove(item)
+        update_bullets(player_bullets, screen_rect)
+        update_bullets(enemy_bullets, screen_rect)
+        update_particles(particles, particle_pool)
 
-        formation.update(player.rect.center)
+        formation.update(player.rect.center, now)
         for enemy in formation.enemies: enemy.shoot(enemy_bullets)
         for fighter in captured_fighters: fighter.update(player.rect)
         if any(f.state == 'RESCUED' and not f.boss for f in captured_fighters):
@@ -309,39 +428,39 @@ def game_loop(screen, clock, font, level, player, captured_fighters):
         for bullet in player_bullets[:]:
             for enemy in formation.enemies[:]:
                 if bullet.rect.colliderect(enemy.rect):
-                    if bullet in player_bullets: player_bullets.remove(bullet)
+                    remove_bullet(player_bullets, bullet)
                     enemy.health -= 1
                     if enemy.health <= 0:
                         player.score += 400 if enemy.type == EnemyType.BOSS and enemy.state == EnemyState.DIVING else 200 if enemy.type == EnemyType.BOSS else 100
-                        create_explosion(particles, enemy.rect.centerx, enemy.rect.centery, RED)
+                        create_explosion(particles, enemy.rect.centerx, enemy.rect.centery, RED, pool=particle_pool)
                         if enemy.captured_ship:
                             enemy.captured_ship.start_rescue(player.rect)
                             enemy.captured_ship = None
-                        formation.enemies.remove(enemy)
+                        formation.remove_enemy(enemy)
                     break
             for fighter in captured_fighters[:]:
                 if fighter.state == 'CAPTURED' and bullet.rect.colliderect(fighter.rect):
-                     if bullet in player_bullets: player_bullets.remove(bullet)
-                     create_explosion(particles, fighter.rect.centerx, fighter.rect.centery, RED)
+                     remove_bullet(player_bullets, bullet)
+                     create_explosion(particles, fighter.rect.centerx, fighter.rect.centery, RED, pool=particle_pool)
                      captured_fighters.remove(fighter)
 
         if not player.is_captured:
             for bullet in enemy_bullets[:]:
                 if bullet.rect.colliderect(player.rect):
-                    enemy_bullets.remove(bullet)
+                    remove_bullet(enemy_bullets, bullet)
                     player.lives -= 1
                     player.dual_fighter = False
-                    create_explosion(particles, player.rect.centerx, player.rect.centery, GREEN)
+                    create_explosion(particles, player.rect.centerx, player.rect.centery, GREEN, pool=particle_pool)
                     if player.lives <= 0: return player.score, 'game_over'
-                    player.is_captured, respawn_timer = True, pygame.time.get_ticks()
+                    player.is_captured, respawn_timer = True, now
             for enemy in formation.enemies[:]:
                 if enemy.state in [EnemyState.DIVING, EnemyState.TRACTOR_BEAM] and enemy.rect.colliderect(player.rect):
                     player.lives -= 1
                     player.dual_fighter = False
-                    create_explosion(particles, player.rect.centerx, player.rect.centery, GREEN, 50)
-                    formation.enemies.remove(enemy)
+                    create_explosion(particles, player.rect.centerx, player.rect.centery, GREEN, 50, pool=particle_pool)
+                    formation.remove_enemy(enemy)
                     if player.lives <= 0: return player.score, 'game_over'
-                    player.is_captured, respawn_timer = True, pygame.time.get_ticks()
+                    player.is_captured, respawn_timer = True, now
                 if enemy.tractor_beam_active and pygame.Rect(enemy.rect.centerx - 50, enemy.rect.bottom, 100, SCREEN_HEIGHT).colliderect(player.rect):
                     player.lives -= 1
                     player.dual_fighter = False
@@ -349,28 +468,32 @@ def game_loop(screen, clock, font, level, player, captured_fighters):
                     captured_fighters.append(enemy.captured_ship)
                     enemy.tractor_beam_active = False
                     if player.lives <= 0: return player.score, 'game_over'
-                    player.is_captured, respawn_timer = True, pygame.time.get_ticks()
+                    player.is_captured, respawn_timer = True, now
                     break
 
-        if player.is_captured and pygame.time.get_ticks() - respawn_timer > 2000:
+        if player.is_captured and now - respawn_timer > 2000:
             player.respawn()
 
         screen.fill(BLACK)
         draw_starfield(screen, stars)
         player.draw(screen)
-        for group in [player_bullets, enemy_bullets, formation.enemies, captured_fighters, particles]:
-            for item in group: item.draw(screen)
-
-        draw_text(f"Score: {player.score}", font, WHITE, screen, 100, 20)
-        draw_text(f"Level: {level}", font, WHITE, screen, SCREEN_WIDTH / 2, 20)
+        draw_sprites(screen, (player_bullets, enemy_bullets))
+        draw_enemies(screen, formation.enemies, now)
+        draw_sprites(screen, (captured_fighters,))
+        draw_particles(screen, particles)
+
+        if player.score != shown_score:
+            shown_score = player.score
+            score_text = render_text(f"Score: {shown_score}", font, WHITE, 100, 20)
+        screen.blit(*score_text)
+        screen.blit(*level_text)
         for i in range(player.lives):
-            ship_rect = pygame.Rect(SCREEN_WIDTH - 40 - (i * (PLAYER_SIZE + 5)), 10, PLAYER_SIZE, PLAYER_SIZE)
-            pygame.draw.polygon(screen, WHITE, [(ship_rect.centerx, ship_rect.top), (ship_rect.left, ship_rect.bottom), (ship_rect.right, ship_rect.bottom)])
+            screen.blit(assets.life_icon, (SCREEN_WIDTH - 40 - (i * (PLAYER_SIZE + 5)), 10))
 
-        if pygame.time.get_ticks() - wave_intro_timer < 2000:
-            draw_text(f"STAGE {level}", font, BLUE, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+        if now - wave_intro_timer < 2000:
+            screen.blit(*stage_text)
         elif not formation.all_enemies_entered():
-             draw_text("GET READY!", font, YELLOW, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+            screen.blit(*ready_text)
 
         if not formation.enemies and formation.all_enemies_entered():
             return player.score, 'next_level'
@@ -378,34 +501,48 @@ def game_loop(screen, clock, font, level, player, captured_fighters):
         pygame.display.flip()
         clock.tick(60)
 
+def create_challenge_paths(total_enemies):
+    """Builds the (enemy type, flight path) pair for every challenging-stage spawn up front."""
+    specs = []
+    for i in range(total_enemies):
+        path_type = i % 3
+        if path_type == 0:
+            # Path 1: Swoop from left
+            specs.append((EnemyType.DRONE, Enemy.generate_bezier_curve((-50, 100 + i*15), (SCREEN_WIDTH/2, 50), (SCREEN_WIDTH - 50, 200), (SCREEN_WIDTH + 50, 100 + i*15), 240)))
+        elif path_type == 1:
+            # Path 2: Swoop from right
+            specs.append((EnemyType.DRONE, Enemy.generate_bezier_curve((SCREEN_WIDTH + 50, 100 + i*15), (SCREEN_WIDTH/2, 50), (50, 200), (-50, 100 + i*15), 240)))
+        else:
+            # Path 3: Figure eight
+            specs.append((EnemyType.BOSS, Enemy.generate_bezier_curve((SCREEN_WIDTH/2, -50), (100, 200), (700, 400), (SCREEN_WIDTH/2, SCREEN_HEIGHT+50), 300)))
+    return specs
+
 def challenging_stage(screen, clock, font, level, player):
     pygame.display.set_caption(f"Galaga - Challenging Stage {level // 4}")
     stars, player_bullets, particles, enemies = create_starfield(100), [], [], []
     start_time = pygame.time.get_ticks()
     total_enemies = 40
     enemies_spawned = 0
+    enemies_destroyed = 0
     last_spawn_time = 0
 
-    # Pre-defined paths for the challenging stage
-    paths = [
-        # Path 1: Swoop from left
-        lambda i: Enemy(EnemyType.DRONE).set_path(Enemy(EnemyType.DRONE).generate_bezier_curve((-50, 100 + i*15), (SCREEN_WIDTH/2, 50), (SCREEN_WIDTH - 50, 200), (SCREEN_WIDTH + 50, 100 + i*15), 240)),
-        # Path 2: Swoop from right
-        lambda i: Enemy(EnemyType.DRONE).set_path(Enemy(EnemyType.DRONE).generate_bezier_curve((SCREEN_WIDTH + 50, 100 + i*15), (SCREEN_WIDTH/2, 50), (50, 200), (-50, 100 + i*15), 240)),
-        # Path 3: Figure eight
-        lambda i: Enemy(EnemyType.BOSS).set_path(Enemy(EnemyType.BOSS).generate_bezier_curve((SCREEN_WIDTH/2, -50), (100, 200), (700, 400), (SCREEN_WIDTH/2, SCREEN_HEIGHT+50), 300))
-    ]
-
-    while pygame.time.get_ticks() - start_time < 20000: # 20 second stage
-        current_time = pygame.time.get_ticks()
+    # Pre-defined paths for the challenging stage, computed once before the stage starts.
+    spawn_specs = create_challenge_paths(total_enemies)
+
+    title_text = render_text("CHALLENGING STAGE", font, YELLOW, SCREEN_WIDTH / 2, 40)
+    shown_destroyed, destroyed_text = None, None
+    screen_rect = screen.get_rect()
+
+    current_time = start_time
+    while current_time - start_time < 20000: # 20 second stage
         if enemies_spawned < total_enemies and current_time - last_spawn_time > 200:
-            path_func = paths[enemies_spawned % len(paths)]
-            enemy = path_func(enemies_spawned)
-            if enemy:
-                enemy.state = EnemyState.CHALLENGE_FLIGHT
-                enemies.append(enemy)
-                enemies_spawned += 1
-                last_spawn_time = current_time
+            enemy_type, path = spawn_specs[enemies_spawned]
+            enemy = Enemy(enemy_type)
+            enemy.set_path(path)
+            enemy.state = EnemyState.CHALLENGE_FLIGHT
+            enemies.append(enemy)
+            enemies_spawned += 1
+            last_spawn_time = current_time
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT: return player.score, 'quit'
@@ -413,43 +550,47 @@ def challenging_stage(screen, clock, font, level, player):
                 if len(player_bullets) < (PLAYER_MAX_BULLETS * (2 if player.dual_fighter else 1)):
                     bullets_to_fire = [player.rect.centerx] if not player.dual_fighter else [player.rect.centerx - PLAYER_SIZE, player.rect.centerx]
                     for x_pos in bullets_to_fire:
-                        player_bullets.append(Bullet(x_pos, player.rect.top, -PLAYER_BULLET_SPEED, WHITE))
+                        spawn_bullet(player_bullets, x_pos, player.rect.top, -PLAYER_BULLET_SPEED, WHITE)
 
         keys = pygame.key.get_pressed()
         if keys[pygame.K_LEFT]: player.move(-PLAYER_SPEED)
         if keys[pygame.K_RIGHT]: player.move(PLAYER_SPEED)
 
-        for group in [player_bullets, enemies, particles]:
-            for item in group[:]:
-                if hasattr(item, 'update'): item.update(player.rect.center)
-                if hasattr(item, 'rect') and not screen.get_rect().colliderect(item.rect) and item in enemies: group.remove(item)
-                elif hasattr(item, 'rect') and item.rect.bottom < 0 and item in player_bullets: group.remove(item)
-                elif hasattr(item, 'life') and item.life <= 0: group.remove(item)
+        update_bullets(player_bullets, screen_rect)
+        for enemy in enemies: enemy.update(player.rect.center, current_time)
+        update_particles(particles, particle_pool)
+        # Challenge enemies spawn off screen, so they leave once their flight path is finished.
+        enemies[:] = [enemy for enemy in enemies if enemy.path_step < len(enemy.path)]
 
         for bullet in player_bullets[:]:
             for enemy in enemies[:]:
                 if bullet.rect.colliderect(enemy.rect):
-                    if bullet in player_bullets: player_bullets.remove(bullet)
+                    remove_bullet(player_bullets, bullet)
                     enemy.health -= 1
                     if enemy.health <= 0:
                         player.score += 500 # Higher score for challenge stage
-                        create_explosion(particles, enemy.rect.centerx, enemy.rect.centery, BLUE)
+                        enemies_destroyed += 1
+                        create_explosion(particles, enemy.rect.centerx, enemy.rect.centery, BLUE, pool=particle_pool)
                         enemies.remove(enemy)
                     break
 
         screen.fill(BLACK)
         draw_starfield(screen, stars)
         player.draw(screen)
-        for group in [player_bullets, enemies, particles]:
-            for item in group: item.draw(screen)
+        draw_sprites(screen, (player_bullets, enemies))
+        draw_particles(screen, particles)
 
-        draw_text("CHALLENGING STAGE", font, YELLOW, screen, SCREEN_WIDTH / 2, 40)
-        draw_text(f"Enemies Destroyed: {total_enemies - len(enemies)}/{total_enemies}", font, WHITE, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT - 40)
+        if enemies_destroyed != shown_destroyed:
+            shown_destroyed = enemies_destroyed
+            destroyed_text = render_text(f"Enemies Destroyed: {shown_destroyed}/{total_enemies}", font, WHITE, SCREEN_WIDTH / 2, SCREEN_HEIGHT - 40)
+        screen.blit(*title_text)
+        screen.blit(*destroyed_text)
 
         pygame.display.flip()
         clock.tick(60)
+        current_time = pygame.time.get_ticks()
 
-    if not enemies:
+    if enemies_destroyed == total_enemies:
         player.score += 10000 # Perfect bonus
         draw_text("PERFECT! +10000", font, GREEN, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, 2000)
 
@@ -501,8 +642,8 @@ def end_screen(screen, clock, font, message):
     BUTTON_COLOR = (50, 50, 50)
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
-    title_font = pygame.font.Font(None, 60)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(60)
+    button_font = get_font(40)
     while True:
         screen.fill(BACKGROUND_COLOR)
         draw_text(message, title_font, HIGHLIGHT_COLOR, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3)
@@ -534,8 +675,8 @@ def next_level_screen(screen, clock, font, level, score):
     BUTTON_COLOR = (50, 50, 50)
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
-    title_font = pygame.font.Font(None, 60)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(60)
+    button_font = get_font(40)
     while True:
         screen.fill(BACKGROUND_COLOR)
         draw_text(f"Level {level} Complete!", title_font, HIGHLIGHT_COLOR, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3)
@@ -563,8 +704,8 @@ def next_level_screen(screen, clock, font, level, score):
 
 def run_game(screen, clock):
     """Main function to manage the game states for Galaga."""
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 36)
+    font = get_font(74)
+    small_font = get_font(36)
 
     while True:
         menu_choice = main_menu(screen, clock, font, small_font)
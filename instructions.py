@@ -6,7 +6,11 @@ import pygame
 
 # Import shared modules and constants.
 from config import BLACK, WHITE, LAUNCHER_WIDTH, LAUNCHER_HEIGHT
-from utils import draw_text
+from utils import render_text, get_font
+
+# Colors are built once so the per-repaint fill and text calls reuse them.
+BACKGROUND_COLOR = pygame.Color(BLACK)
+TEXT_COLOR = pygame.Color(WHITE)
 
 def show_instructions(screen, clock, game_name, instructions_list):
     """
@@ -22,33 +26,45 @@ def show_instructions(screen, clock, game_name, instructions_list):
         str: 'continue' if the user proceeds, 'quit' if the user closes the window.
     """
     # Fonts for the instructions screen.
-    title_font = pygame.font.Font(None, 60)
-    instruction_font = pygame.font.Font(None, 30)
-    small_font = pygame.font.Font(None, 24)
-
-    # Main loop for the instructions screen.
-    running = True
-    while running:
-        screen.fill(BLACK)
-        # Draw the title.
-        draw_text(f"{game_name} Instructions", title_font, WHITE, screen, LAUNCHER_WIDTH / 2, 50)
-
-        # Draw the instruction lines.
-        y_offset = 120
-        for line in instructions_list:
-            draw_text(line, instruction_font, WHITE, screen, LAUNCHER_WIDTH / 2, y_offset)
-            y_offset += 40
-
-        # Prompt the user to continue.
-        draw_text("Press any key or click to continue...", small_font, WHITE, screen, LAUNCHER_WIDTH / 2, LAUNCHER_HEIGHT - 50)
-
-        # Event handling.
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return 'quit'
-            if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-                running = False
-
-        pygame.display.flip()
-        clock.tick(30)
-    return 'continue'
+    title_font = get_font(60)
+    instruction_font = get_font(30)
+    small_font = get_font(24)
+
+    # The text never changes while this screen is open, so format and render it once.
+    # It all sits on the plain background, so it is rendered opaque.
+    text_blits = [render_text(f"{game_name} Instructions", title_font, TEXT_COLOR, LAUNCHER_WIDTH / 2, 50, BACKGROUND_COLOR)]
+    y_offset = 120
+    for line in instructions_list:
+        text_blits.append(render_text(line, instruction_font, TEXT_COLOR, LAUNCHER_WIDTH / 2, y_offset, BACKGROUND_COLOR))
+        y_offset += 40
+    text_blits.append(render_text("Press any key or click to continue...", small_font, TEXT_COLOR, LAUNCHER_WIDTH / 2, LAUNCHER_HEIGHT - 50, BACKGROUND_COLOR))
+
+    # Nothing on this screen reacts to the mouse moving or focus changes, so keep those events out
+    # of the queue while it is open instead of waking up for each one. The caller's setting is restored on exit.
+    ignored_events = [pygame.MOUSEMOTION, pygame.ACTIVEEVENT]
+    previously_blocked = [event_type for event_type in ignored_events if pygame.event.get_blocked(event_type)]
+    pygame.event.set_blocked(ignored_events)
+    try:
+        # Main loop for the instructions screen. The screen is static, so it only repaints after an event.
+        running = True
+        dirty = True
+        while running:
+            if dirty:
+                screen.fill(BACKGROUND_COLOR)
+                # Draw the title, the instruction lines and the prompt to continue.
+                screen.blits(text_blits, False)
+                pygame.display.flip()
+                dirty = False
+
+            # Event handling. Sleep until input arrives instead of redrawing at a fixed rate.
+            for event in [pygame.event.wait(33)] + pygame.event.get():
+                if event.type == pygame.NOEVENT:
+                    continue
+                dirty = True
+                if event.type == pygame.QUIT:
+                    return 'quit'
+                if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+                    running = False
+        return 'continue'
+    finally:
+        pygame.event.set_allowed([event_type for event_type in ignored_events if event_type not in previously_blocked])
@@ -8,64 +8,90 @@ and a settings menu.
 The launcher handles music, user input, and the overall game selection flow.
 """
 
+import importlib
 import pygame
 import sys
 
 # Import shared modules
 # These modules contain configuration variables, utility functions, and score handling.
-from config import LAUNCHER_WIDTH, LAUNCHER_HEIGHT, BLACK, WHITE, GRAY, DEFAULT_MUSIC_VOLUME
-from utils import draw_text, settings_menu
+from config import LAUNCHER_WIDTH, LAUNCHER_HEIGHT, DEFAULT_MUSIC_VOLUME
+from utils import draw_text, render_text, settings_menu, get_font
 import scores
 
-# Import the game modules
-# Each game is in its own module and is imported here.
-import snake_game
-import pong
-import space_invaders
-import breakout
-import asteroids
-import tetris_game
-import minesweeper
-import pacman
-import frogger
-import galaga
-import cyber_ninja
-import beat_em_up
-import tic_tac_toe
-import flappy_bird
-import angry_stones
-
 # --- Initialization ---
 # Initialize all imported Pygame modules.
 pygame.init()
 # Initialize the mixer for sound playback.
 pygame.mixer.init()
 
-# --- Constants ---
-# Define font sizes for the launcher UI.
-FONT_SIZE = 40
-TITLE_FONT_SIZE = 60
-
 # --- Game Configuration ---
-# A dictionary mapping the display name of each game to its corresponding module.
+# A dictionary mapping the display name of each game to the name of its module.
 # This makes it easy to add or remove games from the launcher.
+# Modules are only imported when their game is first launched, which keeps launcher startup fast.
 GAMES = {
-    "Angry Stones": angry_stones,
-    "Flappy Bird": flappy_bird,
-    "Asteroids": asteroids,
-    "Beat 'em Up": beat_em_up,
-    "Breakout": breakout,
-    "Cyber-Ninja Showdown": cyber_ninja,
-    "Minesweeper": minesweeper,
-    "Pac-Man": pacman,
-    "Pong": pong,
-    "Snake": snake_game,
-    "Space Invaders": space_invaders,
-    "Tetris": tetris_game,
-    "Frogger": frogger,
-    "Galaga": galaga,
-    "Tic Tac Toe": tic_tac_toe,
+    "Angry Stones": "angry_stones",
+    "Flappy Bird": "flappy_bird",
+    "Asteroids": "asteroids",
+    "Beat 'em Up": "beat_em_up",
+    "Breakout": "breakout",
+    "Cyber-Ninja Showdown": "cyber_ninja",
+    "Minesweeper": "minesweeper",
+    "Pac-Man": "pacman",
+    "Pong": "pong",
+    "Snake": "snake_game",
+    "Space Invaders": "space_invaders",
+    "Tetris": "tetris_game",
+    "Frogger": "frogger",
+    "Galaga": "galaga",
+    "Tic Tac Toe": "tic_tac_toe",
 }
+# The games in menu order, fixed at import.
+_GAME_LIST = tuple(GAMES.items())
+
+# The game buttons need a display and fonts, so they are built on the first visit to the menu
+# and reused by every later visit.
+_GAME_BUTTONS = []
+
+# --- Colors ---
+# Shared by the menu and high scores screens. Built once as pygame.Color objects
+# so the fill and draw calls don't re-parse a tuple on every call.
+BACKGROUND_COLOR = pygame.Color(20, 20, 40) # Dark Blue/Purple
+TEXT_COLOR = pygame.Color(255, 255, 255) # White
+HIGHLIGHT_COLOR = pygame.Color(255, 215, 0) # Gold
+BUTTON_COLOR = pygame.Color(50, 50, 50) # Dark Gray
+BUTTON_HOVER_COLOR = pygame.Color(80, 80, 80) # Lighter Gray on hover
+BORDER_COLOR = pygame.Color(150, 150, 150) # Medium Gray
+
+# --- Events ---
+# The only event types the launcher screens react to. Anything else left in the queue
+# is picked up by the next pygame.event.wait() call.
+MENU_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL, pygame.MOUSEMOTION, pygame.WINDOWEXPOSED)
+
+def load_game(module_name):
+    """
+    Imports a game module on first use.
+
+    Args:
+        module_name (str): The module name from GAMES.
+
+    Returns:
+        module: The imported game module. Python's module cache makes repeat launches free.
+    """
+    return importlib.import_module(module_name)
+
+def set_launcher_mode():
+    """
+    Opens the launcher window with vsync so flips line up with the display refresh.
+
+    Falls back to a plain window on drivers that cannot create a vsynced renderer.
+
+    Returns:
+        pygame.Surface: The display surface.
+    """
+    try:
+        return pygame.display.set_mode((LAUNCHER_WIDTH, LAUNCHER_HEIGHT), pygame.SCALED, vsync=1)
+    except pygame.error:
+        return pygame.display.set_mode((LAUNCHER_WIDTH, LAUNCHER_HEIGHT))
 
 def show_high_scores(screen, clock):
     """
@@ -79,64 +105,87 @@ def show_high_scores(screen, clock):
         clock (pygame.time.Clock): The Pygame clock object for controlling the frame rate.
     """
     # Fonts for the high scores screen.
-    title_font = pygame.font.Font(None, 80)
-    score_font = pygame.font.Font(None, 40)
-    button_font = pygame.font.Font(None, 40)
-
-    # Colors for a visually appealing high scores screen.
-    BACKGROUND_COLOR = (20, 20, 40) # Dark Blue/Purple
-    TEXT_COLOR = (255, 255, 255) # White
-    HIGHLIGHT_COLOR = (255, 215, 0) # Gold
-    BUTTON_COLOR = (50, 50, 50) # Dark Gray
-    BUTTON_HOVER_COLOR = (80, 80, 80) # Lighter Gray on hover
-    BORDER_COLOR = (150, 150, 150) # Medium Gray
-    
+    title_font = get_font(80)
+    score_font = get_font(40)
+    button_font = get_font(40)
+
     # Load high scores and sort them in descending order.
     high_scores = scores.load_scores()
     sorted_scores = sorted(high_scores.items(), key=lambda item: item[1], reverse=True)
 
-    # Main loop for the high scores screen.
-    while True:
-        # Fill the background.
-        screen.fill(BACKGROUND_COLOR)
-        # Draw the title.
-        draw_text("High Scores", title_font, HIGHLIGHT_COLOR, screen, LAUNCHER_WIDTH / 2, 70)
-
-        # Display the scores.
-        y_offset = 150
-        if not sorted_scores:
-            draw_text("No scores yet! Play some games!", score_font, TEXT_COLOR, screen, LAUNCHER_WIDTH / 2, y_offset + 50)
-        else:
-            # Display the top 10 scores.
-            for i, (game, score) in enumerate(sorted_scores[:10]):
-                color = TEXT_COLOR
-                # Highlight the top score.
-                if i == 0:
-                    color = HIGHLIGHT_COLOR
-                draw_text(f"{game}: {score}", score_font, color, screen, LAUNCHER_WIDTH / 2, y_offset)
-                y_offset += 50
-
-        # Back button to return to the main menu.
-        back_button_rect = pygame.Rect(LAUNCHER_WIDTH / 2 - 125, LAUNCHER_HEIGHT - 70, 250, 60)
-        mx, my = pygame.mouse.get_pos()
-        current_button_color = BUTTON_HOVER_COLOR if back_button_rect.collidepoint((mx, my)) else BUTTON_COLOR
-        
+    # Render the static labels once; only the button color changes between frames.
+    # The title always sits on the plain background, so it is rendered opaque.
+    title_text = render_text("High Scores", title_font, HIGHLIGHT_COLOR, LAUNCHER_WIDTH / 2, 70, BACKGROUND_COLOR)
+
+    # The score list never changes while this screen is open, so draw it once onto its own surface.
+    # The surface is filled with the background color so it can be blitted opaque.
+    scoreboard_top = 125
+    scoreboard_surf = pygame.Surface((LAUNCHER_WIDTH, LAUNCHER_HEIGHT - scoreboard_top)).convert()
+    scoreboard_surf.fill(BACKGROUND_COLOR)
+    y_offset = 150 - scoreboard_top
+    if not sorted_scores:
+        draw_text("No scores yet! Play some games!", score_font, TEXT_COLOR, scoreboard_surf, LAUNCHER_WIDTH / 2, y_offset + 50)
+    else:
+        # Display the top 10 scores, formatted once.
+        score_lines = [f"{game}: {score}" for game, score in sorted_scores[:10]]
+        for i, line in enumerate(score_lines):
+            color = TEXT_COLOR
+            # Highlight the top score.
+            if i == 0:
+                color = HIGHLIGHT_COLOR
+            draw_text(line, score_font, color, scoreboard_surf, LAUNCHER_WIDTH / 2, y_offset)
+            y_offset += 50
+
+    back_button_rect = pygame.Rect(LAUNCHER_WIDTH / 2 - 125, LAUNCHER_HEIGHT - 70, 250, 60)
+    back_text = render_text("Back", button_font, TEXT_COLOR, back_button_rect.centerx, back_button_rect.centery)
+
+    def draw_back_button():
+        current_button_color = BUTTON_HOVER_COLOR if back_hovered else BUTTON_COLOR
         pygame.draw.rect(screen, current_button_color, back_button_rect, border_radius=10)
         pygame.draw.rect(screen, BORDER_COLOR, back_button_rect, 2, border_radius=10)
-        draw_text("Back", button_font, TEXT_COLOR, screen, back_button_rect.centerx, back_button_rect.centery)
+        screen.blit(*back_text)
+
+    # Main loop for the high scores screen. It only repaints after an event arrives;
+    # a hover change alone repaints just the Back button and pushes only its rect to the display.
+    dirty = True
+    back_hovered = False
+    mouse_pos = pygame.mouse.get_pos()
+    while True:
+        if dirty:
+            # Fill the background.
+            screen.fill(BACKGROUND_COLOR)
+            # Draw the title.
+            screen.blit(*title_text)
+
+            # Display the scores.
+            screen.blit(scoreboard_surf, (0, scoreboard_top))
+
+            # Back button to return to the main menu.
+            back_hovered = back_button_rect.collidepoint(mouse_pos)
+            draw_back_button()
+            pygame.display.flip()
+            dirty = False
 
         # Event handling for the high scores screen.
-        for event in pygame.event.get():
+        # Sleep until input arrives instead of redrawing at a fixed rate; the timeout keeps the loop responsive.
+        for event in [pygame.event.wait(33)] + pygame.event.get(MENU_EVENTS):
+            if event.type == pygame.NOEVENT:
+                continue
+            if event.type == pygame.MOUSEMOTION:
+                # Track the cursor from motion events rather than polling it on every repaint.
+                mouse_pos = event.pos
+                if back_button_rect.collidepoint(mouse_pos) != back_hovered:
+                    back_hovered = not back_hovered
+                    draw_back_button()
+                    pygame.display.update(back_button_rect)
+                continue
+            dirty = True
             if event.type == pygame.QUIT:
                 return
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if back_button_rect.collidepoint(event.pos):
                     return # Exit the high scores screen.
 
-        # Update the display and control the frame rate.
-        pygame.display.flip()
-        clock.tick(30)
-
 def main_menu(screen, clock):
     """
     Displays the main game selection menu.
@@ -149,109 +198,178 @@ def main_menu(screen, clock):
         clock (pygame.time.Clock): The Pygame clock object for controlling the frame rate.
     """
     # Fonts for the main menu.
-    title_font = pygame.font.Font(None, 90)
-    button_font = pygame.font.Font(None, 45)
-
-    # Colors for a visually appealing main menu.
-    BACKGROUND_COLOR = (20, 20, 40) # Dark Blue/Purple
-    TEXT_COLOR = (255, 255, 255) # White
-    HIGHLIGHT_COLOR = (255, 215, 0) # Gold
-    BUTTON_COLOR = (50, 50, 50) # Dark Gray
-    BUTTON_HOVER_COLOR = (80, 80, 80) # Lighter Gray on hover
-    BORDER_COLOR = (150, 150, 150) # Medium Gray
+    title_font = get_font(90)
+    button_font = get_font(45)
 
     # Initialize music volume.
     current_music_volume = DEFAULT_MUSIC_VOLUME
     
-    # Create a list of buttons for the game menu.
-    buttons = []
+    # The list of buttons for the game menu.
+    # Each button keeps its unscrolled rect; the on-screen rect is derived from it when scrolling.
+    buttons = _GAME_BUTTONS
     start_y = 180 # Starting Y position for the first button.
-    for i, (game_name, module) in enumerate(GAMES.items()):
-        buttons.append({'text': game_name, 'module': module})
-
-    # Variables for scrolling the menu.
-    scroll_offset = 0
     button_spacing = 70 # Spacing between buttons.
+    button_height = 60
+
+    def make_button(text, rect, radius):
+        """Builds a button dict with its label rendered and centered once."""
+        label_surf, label_rect = render_text(text, button_font, TEXT_COLOR, rect.centerx, rect.centery)
+        return {'text': text, 'rect': rect, 'radius': radius, 'label_surf': label_surf, 'label_rect': label_rect}
+
+    if not buttons:
+        for i, (game_name, module_name) in enumerate(_GAME_LIST):
+            button = make_button(game_name, pygame.Rect(LAUNCHER_WIDTH / 2 - 175, start_y + i * button_spacing, 350, button_height), 15)
+            button['module_name'] = module_name
+            button['base_rect'] = button['rect'].copy()
+            button['base_label_rect'] = button['label_rect'].copy()
+            buttons.append(button)
+
+    # The High Scores and Settings buttons never move.
+    high_scores_button = make_button("High Scores", pygame.Rect(30, LAUNCHER_HEIGHT - 70, 200, 50), 10)
+    settings_button = make_button("Settings", pygame.Rect(LAUNCHER_WIDTH - 230, LAUNCHER_HEIGHT - 70, 200, 50), 10)
+    static_buttons = [high_scores_button, settings_button]
 
-    # Calculate the maximum scroll offset to prevent scrolling past the last button.
-    total_buttons_height = len(buttons) * button_spacing
-    max_scroll = max(0, total_buttons_height - (LAUNCHER_HEIGHT - start_y - 150))
+    # Render the title once; only button colors and positions change between frames.
+    title_text = render_text("Pygame Arcade", title_font, HIGHLIGHT_COLOR, LAUNCHER_WIDTH / 2, 90, BACKGROUND_COLOR)
 
-    # Main loop for the main menu.
+    # Variables for scrolling the menu.
+    scroll_offset = 0
+    visible_buttons = []
+
+    # Calculate the maximum scroll offset so the last button can rise just above the bottom button row.
+    list_bottom = high_scores_button['rect'].top - (button_spacing - button_height)
+    max_scroll = max(0, buttons[-1]['base_rect'].bottom - list_bottom)
+
+    list_left, list_right = buttons[0]['base_rect'].left, buttons[0]['base_rect'].right
+
+    def find_hovered(pos):
+        """Returns the on-screen button under `pos`, or None."""
+        # Game buttons sit on a uniform vertical grid, so the row under the cursor is found directly
+        # from the scroll offset the screen was last laid out with.
+        mx, my = pos
+        row, row_offset = divmod(my + background_scroll - start_y, button_spacing)
+        if list_left <= mx < list_right and row_offset < button_height and 0 <= row < len(buttons):
+            return buttons[row]
+        for button in static_buttons:
+            if button['rect'].collidepoint(pos):
+                return button
+        return None
+
+    def draw_button_frame(surface, button, color):
+        pygame.draw.rect(surface, color, button['rect'], border_radius=button['radius'])
+        pygame.draw.rect(surface, BORDER_COLOR, button['rect'], 2, border_radius=button['radius'])
+
+    def draw_button(surface, button, color):
+        draw_button_frame(surface, button, color)
+        surface.blit(button['label_surf'], button['label_rect'])
+
+    # Main loop for the main menu. It only repaints after an event arrives; a hover change
+    # alone repaints just the two affected buttons and pushes only their rects to the display.
+    dirty = True
+    hovered = None
+    background = None
+    background_scroll = None
+    mouse_pos = pygame.mouse.get_pos()
     while True:
-        # Fill the background.
-        screen.fill(BACKGROUND_COLOR)
-        # Draw the title.
-        draw_text("Pygame Arcade", title_font, HIGHLIGHT_COLOR, screen, LAUNCHER_WIDTH / 2, 90)
-        
-        # Get the current mouse position.
-        mx, my = pygame.mouse.get_pos()
-
-        # Draw the game selection buttons.
-        for i, button in enumerate(buttons):
-            y_pos = start_y + (i * button_spacing) - scroll_offset
-            button_rect = pygame.Rect(LAUNCHER_WIDTH / 2 - 175, y_pos, 350, 60)
-            button['rect'] = button_rect # Store the rect for collision detection.
-
-            # Only draw the button if it is within the visible area of the screen.
-            if y_pos < LAUNCHER_HEIGHT and y_pos + button_rect.height > 0:
-                color = BUTTON_HOVER_COLOR if button_rect.collidepoint((mx, my)) else BUTTON_COLOR
-                pygame.draw.rect(screen, color, button_rect, border_radius=15)
-                pygame.draw.rect(screen, BORDER_COLOR, button_rect, 2, border_radius=15)
-                draw_text(button['text'], button_font, TEXT_COLOR, screen, button_rect.centerx, button_rect.centery)
-
-        # Draw the High Scores button.
-        high_scores_button_rect = pygame.Rect(30, LAUNCHER_HEIGHT - 70, 200, 50)
-        high_scores_button_color = BUTTON_HOVER_COLOR if high_scores_button_rect.collidepoint((mx, my)) else BUTTON_COLOR
-        pygame.draw.rect(screen, high_scores_button_color, high_scores_button_rect, border_radius=10)
-        pygame.draw.rect(screen, BORDER_COLOR, high_scores_button_rect, 2, border_radius=10)
-        draw_text("High Scores", button_font, TEXT_COLOR, screen, high_scores_button_rect.centerx, high_scores_button_rect.centery)
-
-        # Draw the Settings button.
-        settings_button_rect = pygame.Rect(LAUNCHER_WIDTH - 230, LAUNCHER_HEIGHT - 70, 200, 50)
-        settings_button_color = BUTTON_HOVER_COLOR if settings_button_rect.collidepoint((mx, my)) else BUTTON_COLOR
-        pygame.draw.rect(screen, settings_button_color, settings_button_rect, border_radius=10)
-        pygame.draw.rect(screen, BORDER_COLOR, settings_button_rect, 2, border_radius=10)
-        draw_text("Settings", button_font, TEXT_COLOR, screen, settings_button_rect.centerx, settings_button_rect.centery)
+        if dirty:
+            if scroll_offset != background_scroll:
+                # Work out which buttons intersect the screen from the scroll offset alone,
+                # and only position and draw those.
+                first_visible = max(0, (scroll_offset - start_y - button_height) // button_spacing + 1)
+                last_visible = min(len(buttons), (scroll_offset + LAUNCHER_HEIGHT - start_y + button_spacing - 1) // button_spacing)
+                visible_buttons = buttons[first_visible:last_visible]
+                # Each button owns its on-screen rects, so they are shifted in place rather than reallocated.
+                for button in visible_buttons:
+                    button['rect'].y = button['base_rect'].y - scroll_offset # Store the rect for collision detection.
+                    button['label_rect'].y = button['base_label_rect'].y - scroll_offset
+
+                # Everything except the hover highlight is static for a given scroll offset, so compose
+                # the fill, title and un-hovered buttons once and reuse it until the menu scrolls.
+                background = pygame.Surface((LAUNCHER_WIDTH, LAUNCHER_HEIGHT)).convert()
+                background.fill(BACKGROUND_COLOR)
+                # The title goes down first so buttons scrolled up past it are drawn over it.
+                background.blit(*title_text)
+                menu_buttons = visible_buttons + static_buttons
+                for button in menu_buttons:
+                    draw_button_frame(background, button, BUTTON_COLOR)
+                # Submit every label in a single blits() call instead of one blit per button.
+                background.blits([(button['label_surf'], button['label_rect']) for button in menu_buttons], False)
+                background_scroll = scroll_offset
+
+            screen.blit(background, (0, 0))
+            hovered = find_hovered(mouse_pos)
+            if hovered:
+                draw_button(screen, hovered, BUTTON_HOVER_COLOR)
+            pygame.display.flip()
+            dirty = False
 
         # Event handling for the main menu.
-        for event in pygame.event.get():
+        # Sleep until input arrives instead of redrawing at a fixed rate; the timeout keeps the loop responsive.
+        # Wheel ticks are summed over the batch and applied with a single clamp afterwards.
+        wheel_dy = 0
+        for event in [pygame.event.wait(33)] + pygame.event.get(MENU_EVENTS):
+            if event.type == pygame.NOEVENT:
+                continue
+            if event.type == pygame.MOUSEMOTION:
+                # Track the cursor from motion events rather than polling it on every repaint.
+                mouse_pos = event.pos
+                new_hovered = find_hovered(mouse_pos)
+                if new_hovered is not hovered:
+                    changed = [button['rect'] for button in (hovered, new_hovered) if button]
+                    if hovered:
+                        screen.blit(background, hovered['rect'], hovered['rect'])
+                    if new_hovered:
+                        draw_button(screen, new_hovered, BUTTON_HOVER_COLOR)
+                    hovered = new_hovered
+                    pygame.display.update(changed)
+                continue
             if event.type == pygame.QUIT:
                 return
+            if event.type == pygame.WINDOWEXPOSED:
+                # The window contents were lost, e.g. after being uncovered or restored.
+                dirty = True
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                # Check if a game button was clicked.
-                for button in buttons:
-                    if button.get('rect') and button['rect'].collidepoint(event.pos):
-                        # Run the selected game.
-                        button['module'].run_game(screen, clock)
-                        # Reset the screen and caption for the launcher.
-                        pygame.display.set_caption("Pygame Arcade")
-                        screen = pygame.display.set_mode((LAUNCHER_WIDTH, LAUNCHER_HEIGHT))
-                        # Re-apply launcher music settings after returning from a game.
-                        pygame.mixer.music.set_volume(current_music_volume)
-                        pygame.mixer.music.play(-1)
+                clicked = find_hovered(event.pos)
+                # Every button hands the window to another screen, which has to be painted over on return.
+                if clicked:
+                    dirty = True
 
                 # Check if the High Scores button was clicked.
-                if high_scores_button_rect.collidepoint(event.pos):
+                if clicked is high_scores_button:
                     show_high_scores(screen, clock)
 
                 # Check if the Settings button was clicked.
-                if settings_button_rect.collidepoint(event.pos):
+                elif clicked is settings_button:
                     new_volume, status = settings_menu(screen, clock, LAUNCHER_WIDTH, LAUNCHER_HEIGHT, current_music_volume)
                     current_music_volume = new_volume
                     pygame.mixer.music.set_volume(current_music_volume)
                     if status == 'quit':
                         return # Exit the launcher.
 
+                # Otherwise check if a game button was clicked.
+                elif clicked:
+                    # Run the selected game.
+                    load_game(clicked['module_name']).run_game(screen, clock)
+                    # Reset the screen and caption for the launcher.
+                    pygame.display.set_caption("Pygame Arcade")
+                    screen = set_launcher_mode()
+                    # Re-apply launcher music settings after returning from a game.
+                    pygame.mixer.music.set_volume(current_music_volume)
+                    pygame.mixer.music.play(-1)
+
+                # The cursor may have moved while another screen had the focus.
+                mouse_pos = pygame.mouse.get_pos()
+
             # Handle mouse wheel scrolling for the game menu.
             if event.type == pygame.MOUSEWHEEL:
-                scroll_offset -= event.y * 30
-                # Clamp the scroll offset to the valid range.
-                scroll_offset = max(0, min(scroll_offset, max_scroll))
+                wheel_dy -= event.y * 30
 
-        # Update the display and control the frame rate.
-        pygame.display.flip()
-        clock.tick(30)
+        if wheel_dy:
+            # Clamp the scroll offset to the valid range.
+            new_scroll_offset = max(0, min(scroll_offset + wheel_dy, max_scroll))
+            if new_scroll_offset != scroll_offset:
+                scroll_offset = new_scroll_offset
+                dirty = True
 
 if __name__ == "__main__":
     # This block runs when the script is executed directly.
@@ -265,7 +383,7 @@ if __name__ == "__main__":
         print("Could not load menu music. Make sure 'assets/music/menu_theme.wav' exists.")
 
     # Set up the display screen and caption.
-    screen = pygame.display.set_mode((LAUNCHER_WIDTH, LAUNCHER_HEIGHT))
+    screen = set_launcher_mode()
     pygame.display.set_caption("Pygame Arcade")
     # Create a clock object to control the frame rate.
     clock = pygame.time.Clock()
@@ -274,12 +392,4 @@ if __name__ == "__main__":
     # Quit Pygame and exit the program when the main menu loop finishes.
     pygame.quit()
     sys.exit()
-
-# Add a placeholder get_instructions function if needed by other modules.
-# This can be useful for maintaining a consistent interface across all game modules.
-def get_instructions():
-    """
-    Returns a list of instructions for the launcher.
-    """
-    return ["Select a game from the menu."]
-    
\ No newline at end of file
+    
@@ -8,18 +8,18 @@ This script contains the game logic for Minesweeper, including the grid, cells,
 import pygame
 import sys
 import random
+from collections import deque
 
 # Import shared modules and constants.
-from utils import draw_text, pause_menu, settings_menu, Particle, create_explosion
+from utils import render_text, get_font, pause_menu, settings_menu, create_explosion, update_particles
 
 # --- Initialization ---
 # Initialize all imported Pygame modules.
 pygame.init()
 
 # --- Constants ---
-# Grid dimensions and mine count.
-# These will be overridden by level settings.
-GRID_SIZE, NUM_MINES, CELL_SIZE = 20, 40, 40
+# Grid dimensions. The grid size used in play comes from the level settings.
+GRID_SIZE, CELL_SIZE = 20, 40
 # Screen dimensions derived from grid size and cell size.
 WIDTH, HEIGHT = GRID_SIZE * CELL_SIZE, GRID_SIZE * CELL_SIZE
 
@@ -28,6 +28,9 @@ WHITE, GRAY, DARK_GRAY, BLACK, RED = (255, 255, 255), (192, 192, 192), (128, 128
 # Colors for the numbers indicating adjacent mines.
 COLORS = [(0, 0, 255), (0, 128, 0), (255, 0, 0), (0, 0, 128), (128, 0, 0), (0, 128, 128), (0, 0, 0), (128, 128, 128)]
 
+# Offsets of the eight cells surrounding a cell.
+_NEIGHBORS8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
 # Level configurations
 LEVEL_CONFIGS = {
     1: {'grid_size': 10, 'num_mines': 10},
@@ -37,10 +40,27 @@ LEVEL_CONFIGS = {
     5: {'grid_size': 20, 'num_mines': 75},
 }
 
+def set_display_size(size):
+    """
+    Returns the display surface at the given size, only re-creating the window when the size changes.
+
+    Args:
+        size (tuple): The (width, height) the window should have.
+
+    Returns:
+        pygame.Surface: The display surface.
+    """
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != size:
+        screen = pygame.display.set_mode(size)
+    return screen
+
 class Cell:
     """
     Represents a single cell in the Minesweeper grid.
     """
+    __slots__ = ('x', 'y', 'rect', 'neighbors', 'is_mine', 'is_revealed', 'is_flagged', 'adjacent_mines')
+
     def __init__(self, x, y):
         """
         Initializes a Cell object.
@@ -50,45 +70,96 @@ class Cell:
             y (int): The y-coordinate of the cell in the grid.
         """
         self.x, self.y = x, y
+        # A cell never moves, so its screen rect is computed once.
+        self.rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
         self.is_mine = self.is_revealed = self.is_flagged = False
         self.adjacent_mines = 0
-        self.animation_timer = 0
+        # The in-bounds surrounding cells, filled in by create_board.
+        self.neighbors = ()
+
+    def tile_key(self):
+        """Returns the TILE_CACHE key for the cell's current state."""
+        if self.is_revealed:
+            return 'mine' if self.is_mine else self.adjacent_mines
+        return 'flagged' if self.is_flagged else 'hidden'
 
-    def draw(self, surface, font):
+    def draw(self, surface):
         """
-        Draws the cell on the screen.
+        Draws the cell on the screen by blitting its pre-rendered tile.
 
         Args:
             surface (pygame.Surface): The surface to draw on.
-            font (pygame.font.Font): The font for drawing the number of adjacent mines.
         """
-        rect = pygame.Rect(self.x * CELL_SIZE, self.y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-        if self.is_revealed:
-            pygame.draw.rect(surface, DARK_GRAY, rect)
-            if self.is_mine:
-                pygame.draw.circle(surface, RED, rect.center, CELL_SIZE // 3)
-            elif self.adjacent_mines > 0:
-                text = font.render(str(self.adjacent_mines), True, COLORS[self.adjacent_mines - 1])
-                surface.blit(text, text.get_rect(center=rect.center))
+        surface.blit(TILE_CACHE[self.tile_key()], self.rect)
+
+# --- Tile Cache ---
+# Every cell looks like one of a dozen fixed tiles, so each is drawn once and blitted from here.
+# Keys are 'hidden', 'flagged', 'mine', or the adjacent mine count (0-8) of a revealed cell.
+TILE_CACHE = {}
+
+def _build_tile_cache(font):
+    """
+    Draws every cell tile once. Must be called after a display mode is set.
+
+    Args:
+        font (pygame.font.Font): The font for drawing the number of adjacent mines.
+    """
+    rect = pygame.Rect(0, 0, CELL_SIZE, CELL_SIZE)
+
+    def new_tile(revealed):
+        # Created in the display's pixel format, so the finished tile blits without conversion.
+        tile = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+        if revealed:
+            tile.fill(DARK_GRAY)
         else:
             # 3D effect for unrevealed cells
-            pygame.draw.rect(surface, GRAY, rect)
-            pygame.draw.line(surface, WHITE, rect.topleft, rect.topright, 2)
-            pygame.draw.line(surface, WHITE, rect.topleft, rect.bottomleft, 2)
-            pygame.draw.line(surface, DARK_GRAY, rect.bottomleft, rect.bottomright, 2)
-            pygame.draw.line(surface, DARK_GRAY, rect.topright, rect.bottomright, 2)
-
-            if self.is_flagged:
-                if self.animation_timer < 10:
-                    self.animation_timer += 1
-                flag_poly = [
-                    (rect.centerx, rect.top + 5),
-                    (rect.right - 5, rect.centery - 5),
-                    (rect.centerx, rect.centery)
-                ]
-                pygame.draw.polygon(surface, RED, flag_poly)
-                pygame.draw.line(surface, BLACK, (rect.centerx, rect.top + 5), (rect.centerx, rect.bottom - 5), 3)
-        pygame.draw.rect(surface, BLACK, rect, 1)
+            tile.fill(GRAY)
+            pygame.draw.line(tile, WHITE, rect.topleft, rect.topright, 2)
+            pygame.draw.line(tile, WHITE, rect.topleft, rect.bottomleft, 2)
+            pygame.draw.line(tile, DARK_GRAY, rect.bottomleft, rect.bottomright, 2)
+            pygame.draw.line(tile, DARK_GRAY, rect.topright, rect.bottomright, 2)
+        return tile
+
+    def finish(key, tile):
+        pygame.draw.rect(tile, BLACK, rect, 1)
+        TILE_CACHE[key] = tile
+
+    finish('hidden', new_tile(False))
+
+    tile = new_tile(False)
+    flag_poly = [
+        (rect.centerx, rect.top + 5),
+        (rect.right - 5, rect.centery - 5),
+        (rect.centerx, rect.centery)
+    ]
+    pygame.draw.polygon(tile, RED, flag_poly)
+    pygame.draw.line(tile, BLACK, (rect.centerx, rect.top + 5), (rect.centerx, rect.bottom - 5), 3)
+    finish('flagged', tile)
+
+    tile = new_tile(True)
+    pygame.draw.circle(tile, RED, rect.center, CELL_SIZE // 3)
+    finish('mine', tile)
+
+    finish(0, new_tile(True))
+    for count in range(1, 9):
+        tile = new_tile(True)
+        text = font.render(str(count), True, COLORS[count - 1])
+        tile.blit(text, text.get_rect(center=rect.center))
+        finish(count, tile)
+
+# --- Particles ---
+# Burnt-out particles are kept here and reused by the next explosion instead of being reallocated.
+particle_pool = []
+
+def draw_board(surface, board):
+    """
+    Draws every cell of the board with a single blits() call.
+
+    Args:
+        surface (pygame.Surface): The surface to draw on.
+        board (list): The game board.
+    """
+    surface.blits([(TILE_CACHE[cell.tile_key()], cell.rect) for cell in board], False)
 
 def main_menu(screen, clock, font, small_font):
     """
@@ -112,31 +183,36 @@ def main_menu(screen, clock, font, small_font):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    # Main loop for the menu.
-    while True:
-        screen.fill(BACKGROUND_COLOR)
-        draw_text("Minesweeper", font, HIGHLIGHT_COLOR, screen, LAUNCHER_WIDTH / 2, LAUNCHER_HEIGHT / 4)
+    # The layout is static, so the button rects and all text are built once before the loop.
+    title_text = render_text("Minesweeper", font, HIGHLIGHT_COLOR, LAUNCHER_WIDTH / 2, LAUNCHER_HEIGHT / 4)
 
-        mx, my = pygame.mouse.get_pos()
+    # Define button properties.
+    button_width = 250
+    button_height = 60
+    button_spacing = 20
+
+    settings_y = LAUNCHER_HEIGHT / 2 - 50
+    start_y = settings_y + button_height + button_spacing
+    quit_y = start_y + button_height + button_spacing
 
-        # Define button properties.
-        button_width = 250
-        button_height = 60
-        button_spacing = 20
+    settings_button_rect = pygame.Rect(LAUNCHER_WIDTH / 2 - button_width / 2, settings_y, button_width, button_height)
+    start_button_rect = pygame.Rect(LAUNCHER_WIDTH / 2 - button_width / 2, start_y, button_width, button_height)
+    quit_button_rect = pygame.Rect(LAUNCHER_WIDTH / 2 - button_width / 2, quit_y, button_width, button_height)
 
-        settings_y = LAUNCHER_HEIGHT / 2 - 50
-        start_y = settings_y + button_height + button_spacing
-        quit_y = start_y + button_height + button_spacing
+    buttons = [
+        {"text": "Settings", "rect": settings_button_rect, "action": "settings"},
+        {"text": "Start Game", "rect": start_button_rect, "action": "play"},
+        {"text": "Back to Menu", "rect": quit_button_rect, "action": "quit"}
+    ]
+    for button in buttons:
+        button["label"] = render_text(button["text"], small_font, TEXT_COLOR, button["rect"].centerx, button["rect"].centery)
 
-        settings_button_rect = pygame.Rect(LAUNCHER_WIDTH / 2 - button_width / 2, settings_y, button_width, button_height)
-        start_button_rect = pygame.Rect(LAUNCHER_WIDTH / 2 - button_width / 2, start_y, button_width, button_height)
-        quit_button_rect = pygame.Rect(LAUNCHER_WIDTH / 2 - button_width / 2, quit_y, button_width, button_height)
+    # Main loop for the menu.
+    while True:
+        screen.fill(BACKGROUND_COLOR)
+        screen.blit(*title_text)
 
-        buttons = [
-            {"text": "Settings", "rect": settings_button_rect, "action": "settings"},
-            {"text": "Start Game", "rect": start_button_rect, "action": "play"},
-            {"text": "Back to Menu", "rect": quit_button_rect, "action": "quit"}
-        ]
+        mx, my = pygame.mouse.get_pos()
 
         # Event handling for the menu.
         for event in pygame.event.get():
@@ -156,7 +232,7 @@ def main_menu(screen, clock, font, small_font):
             current_button_color = BUTTON_HOVER_COLOR if button["rect"].collidepoint(mx, my) else BUTTON_COLOR
             pygame.draw.rect(screen, current_button_color, button["rect"], border_radius=10)
             pygame.draw.rect(screen, BORDER_COLOR, button["rect"], 2, border_radius=10)
-            draw_text(button["text"], small_font, TEXT_COLOR, screen, button["rect"].centerx, button["rect"].centery)
+            screen.blit(*button["label"])
 
         pygame.display.flip()
         clock.tick(15)
@@ -170,51 +246,96 @@ def create_board(grid_size, num_mines):
         num_mines (int): The number of mines to place on the board.
 
     Returns:
-        list: A 2D list of Cell objects representing the game board.
+        list: A flat list of Cell objects representing the game board; the cell at (x, y) is at index x * grid_size + y.
     """
-    board = [[Cell(x, y) for y in range(grid_size)] for x in range(grid_size)]
-    # Place mines randomly.
-    mines_placed = 0
-    while mines_placed < num_mines:
-        x, y = random.randint(0, grid_size - 1), random.randint(0, grid_size - 1)
-        if not board[x][y].is_mine:
-            board[x][y].is_mine = True
-            mines_placed += 1
-    # Calculate adjacent mines for each cell.
-    for x in range(grid_size):
-        for y in range(grid_size):
-            if not board[x][y].is_mine:
-                count = 0
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < grid_size and 0 <= ny < grid_size and board[nx][ny].is_mine:
-                            count += 1
-                board[x][y].adjacent_mines = count
+    board = [Cell(x, y) for x in range(grid_size) for y in range(grid_size)]
+    # Link every cell to its in-bounds neighbors once, so neither the adjacency count
+    # nor the flood fill has to do offset arithmetic or bounds checks.
+    for cell in board:
+        cell.neighbors = tuple(board[(cell.x + dx) * grid_size + cell.y + dy] for dx, dy in _NEIGHBORS8
+                               if 0 <= cell.x + dx < grid_size and 0 <= cell.y + dy < grid_size)
+    # Place mines randomly. Sampling distinct indices needs no retries when a cell is already a mine.
+    mines = [board[index] for index in random.sample(range(grid_size * grid_size), num_mines)]
+    for cell in mines:
+        cell.is_mine = True
+    # Calculate adjacent mines for each cell by letting every mine bump its neighbors' counts,
+    # which touches only the cells around the mines instead of scanning every cell's neighborhood.
+    for cell in mines:
+        for neighbor in cell.neighbors:
+            if not neighbor.is_mine:
+                neighbor.adjacent_mines += 1
     return board
 
-def reveal_cells(board, x, y, grid_size):
+def reveal_cells(board, x, y, grid_size, dirty):
     """
-    Recursively reveals cells starting from the given coordinates.
+    Reveals cells starting from the given coordinates, flooding outwards across empty cells.
 
     Args:
         board (list): The game board.
         x (int): The x-coordinate of the cell to reveal.
         y (int): The y-coordinate of the cell to reveal.
         grid_size (int): The size of the grid.
+        dirty (set): Receives the (x, y) of every cell revealed, so only those are redrawn.
+
+    Returns:
+        int: The number of cells newly revealed.
     """
-    if not (0 <= x < grid_size and 0 <= y < grid_size): return
-    cell = board[x][y]
-    if cell.is_revealed or cell.is_flagged: return
+    revealed = 0
+    # Flood fill with an explicit stack rather than recursion, so large empty regions
+    # cost no Python call frames and can't hit the recursion limit.
+    stack = deque([board[x * grid_size + y]])
+    while stack:
+        cell = stack.pop()
+        if cell.is_revealed or cell.is_flagged: continue
+
+        cell.is_revealed = True
+        dirty.add((cell.x, cell.y))
+        revealed += 1
+
+        # If the cell has no adjacent mines, reveal its neighbors.
+        if cell.adjacent_mines == 0 and not cell.is_mine:
+            stack.extend(cell.neighbors)
+    return revealed
+
+# --- End Message Overlay ---
+# The dimming overlay only depends on the window size, so one is kept per size.
+_OVERLAY_CACHE = {}
+
+def _get_overlay(size):
+    """Returns the semi-transparent end message overlay for a window of the given size."""
+    overlay = _OVERLAY_CACHE.get(size)
+    if overlay is None:
+        overlay = _OVERLAY_CACHE[size] = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        overlay.fill((0, 0, 0, 180))
+    return overlay
+
+# End message and button labels are rendered once per text, font and color and reused every frame.
+_TEXT_CACHE = {}
+
+def _get_text(text, font, color):
+    """Returns the rendered surface for `text`, rendering it on first use."""
+    key = (text, font, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = _TEXT_CACHE[key] = font.render(text, True, color).convert_alpha()
+    return surface
+
+def _blit_centered(screen, surface, x, y):
+    """Blits `surface` centered on (x, y)."""
+    screen.blit(surface, surface.get_rect(center=(x, y)))
+
+def _end_button_rects(width, height):
+    """Returns the (restart, quit) button rects of the end message for a window of the given size."""
+    button_width = 250
+    button_height = 60
+    button_spacing = 20
 
-    cell.is_revealed = True
+    restart_y = height / 2 + 20
+    quit_y = restart_y + button_height + button_spacing
 
-    # If the cell has no adjacent mines, reveal its neighbors.
-    if cell.adjacent_mines == 0 and not cell.is_mine:
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx != 0 or dy != 0:
-                    reveal_cells(board, x + dx, y + dy, grid_size)
+    restart_button_rect = pygame.Rect(width / 2 - button_width / 2, restart_y, button_width, button_height)
+    quit_button_rect = pygame.Rect(width / 2 - button_width / 2, quit_y, button_width, button_height)
+    return restart_button_rect, quit_button_rect
 
 def draw_end_message(screen, font, message, color, current_level, win=False):
     """
@@ -238,25 +359,15 @@ def draw_end_message(screen, font, message, color, current_level, win=False):
     current_width = screen.get_width()
     current_height = screen.get_height()
 
-    # Create a semi-transparent overlay.
-    overlay = pygame.Surface((current_width, current_height), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    screen.blit(overlay, (0, 0))
+    # Dim the board with a semi-transparent overlay.
+    screen.blit(_get_overlay((current_width, current_height)), (0, 0))
 
     # Draw the message.
-    draw_text(message, font, color, screen, current_width / 2, current_height / 2 - 50)
+    _blit_centered(screen, _get_text(message, font, color), current_width / 2, current_height / 2 - 50)
 
     # Draw Restart and Quit buttons.
-    button_font = pygame.font.Font(None, 30)
-    button_width = 250
-    button_height = 60
-    button_spacing = 20
-
-    restart_y = current_height / 2 + 20
-    quit_y = restart_y + button_height + button_spacing
-
-    restart_button_rect = pygame.Rect(current_width / 2 - button_width / 2, restart_y, button_width, button_height)
-    quit_button_rect = pygame.Rect(current_width / 2 - button_width / 2, quit_y, button_width, button_height)
+    button_font = get_font(30)
+    restart_button_rect, quit_button_rect = _end_button_rects(current_width, current_height)
 
     mx, my = pygame.mouse.get_pos()
 
@@ -265,15 +376,15 @@ def draw_end_message(screen, font, message, color, current_level, win=False):
     pygame.draw.rect(screen, current_button_color, restart_button_rect, border_radius=10)
     pygame.draw.rect(screen, BORDER_COLOR, restart_button_rect, 2, border_radius=10)
     button_text = "Next Level (R)" if win else "Restart (R)"
-    draw_text(button_text, button_font, TEXT_COLOR, screen, restart_button_rect.centerx, restart_button_rect.centery)
+    _blit_centered(screen, _get_text(button_text, button_font, TEXT_COLOR), restart_button_rect.centerx, restart_button_rect.centery)
 
     # Draw Quit button with hover effect.
     current_button_color = BUTTON_HOVER_COLOR if quit_button_rect.collidepoint(mx, my) else BUTTON_COLOR
     pygame.draw.rect(screen, current_button_color, quit_button_rect, border_radius=10)
     pygame.draw.rect(screen, BORDER_COLOR, quit_button_rect, 2, border_radius=10)
-    draw_text("Quit (Q)", button_font, TEXT_COLOR, screen, quit_button_rect.centerx, quit_button_rect.centery)
+    _blit_centered(screen, _get_text("Quit (Q)", button_font, TEXT_COLOR), quit_button_rect.centerx, quit_button_rect.centery)
 
-def game_loop(screen, clock, font, cell_font, level):
+def game_loop(screen, clock, font, level):
     """
     The main game loop for Minesweeper.
 
@@ -281,11 +392,10 @@ def game_loop(screen, clock, font, cell_font, level):
         screen (pygame.Surface): The main screen surface to draw on.
         clock (pygame.time.Clock): The Pygame clock object for controlling the frame rate.
         font (pygame.font.Font): The font for UI text.
-        cell_font (pygame.font.Font): The font for the numbers in the cells.
         level (int): The current game level.
 
     Returns:
-        str: The outcome of the game ('win', 'game_over', or 'quit').
+        str: The outcome of the game ('win', 'restart' after a loss, or 'quit').
     """
     pygame.display.set_caption(f"Minesweeper - Level {level}")
 
@@ -296,17 +406,42 @@ def game_loop(screen, clock, font, cell_font, level):
     # Adjust screen size based on current_grid_size
     current_width = current_grid_size * CELL_SIZE
     current_height = current_grid_size * CELL_SIZE
-    screen = pygame.display.set_mode((current_width, current_height))
+    screen = set_display_size((current_width, current_height))
 
     # Initialize game state.
     board = create_board(current_grid_size, current_num_mines)
     game_over = game_won = False
     particles = []
+    # While the board is in play, only cells that changed are redrawn and pushed to the display.
+    # A full redraw happens on the first frame, after a menu covered the board, while particles
+    # are on screen, and when input arrives while the end message is shown.
+    dirty_cells = set()
+    redraw_all = True
+    # Running count of revealed cells, so the win check doesn't rescan the board every frame.
+    revealed_count = 0
+    # Nothing is drawn while the window is minimized.
+    visible = True
 
     # Main game loop.
     while True:
-        # Event handling.
-        for event in pygame.event.get():
+        # Event handling. The queue is drained exactly once per frame; the end message buttons
+        # are handled here too, guarded by the game state. While no particles are animating,
+        # sleep until input arrives instead of spinning at the frame rate; the timeout keeps the loop responsive.
+        if particles and visible:
+            events = pygame.event.get()
+        else:
+            events = [pygame.event.wait(33)] + pygame.event.get()
+        for event in events:
+            if event.type == pygame.NOEVENT:
+                continue
+            if event.type == pygame.ACTIVEEVENT and event.state & pygame.APPACTIVE:
+                # The window was minimized or restored; repaint everything when it comes back.
+                visible = bool(event.gain)
+                redraw_all = True
+                continue
+            if game_over or game_won:
+                # The end message's button hover may have changed.
+                redraw_all = True
             if event.type == pygame.QUIT:
                 return 'quit'
             if event.type == pygame.KEYDOWN:
@@ -314,94 +449,78 @@ def game_loop(screen, clock, font, cell_font, level):
                     # Pause the game.
                     pause_choice = pause_menu(screen, clock, current_width, current_height)
                     if pause_choice == 'quit': return 'quit'
+                    redraw_all = True
                 if event.key == pygame.K_s:
                     # Open the settings menu.
                     new_volume, status = settings_menu(screen, clock, current_width, current_height, pygame.mixer.music.get_volume())
                     if status == 'quit': return 'quit'
+                    redraw_all = True
                 if game_over or game_won:
                     if event.key == pygame.K_r:
-                        # Restart the game.
-                        return 'restart' # Signal to restart the current level
+                        # Restart the level after a loss, or move on to the next one after a win.
+                        return 'restart' if game_over else 'win'
                     if event.key == pygame.K_q:
                         # Quit to the main menu.
                         return 'quit'
-            if event.type == pygame.MOUSEBUTTONDOWN and not game_over and not game_won:
+            if event.type == pygame.MOUSEBUTTONDOWN and (game_over or game_won):
+                # Check the end message buttons.
+                restart_button_rect, quit_button_rect = _end_button_rects(current_width, current_height)
+                if restart_button_rect.collidepoint(event.pos): return 'restart' if game_over else 'win'
+                if quit_button_rect.collidepoint(event.pos): return 'quit'
+            elif event.type == pygame.MOUSEBUTTONDOWN:
                 mx, my = event.pos
                 grid_x, grid_y = mx // CELL_SIZE, my // CELL_SIZE
+                clicked_cell = board[grid_x * current_grid_size + grid_y]
 
                 if event.button == 1:  # Left click
-                    reveal_cells(board, grid_x, grid_y, current_grid_size)
-                    if board[grid_x][grid_y].is_mine:
+                    revealed_count += reveal_cells(board, grid_x, grid_y, current_grid_size, dirty_cells)
+                    if clicked_cell.is_mine:
                         game_over = True
                         # Reveal all mines when the game is over.
-                        for row in board:
-                            for cell in row:
-                                if cell.is_mine:
-                                    cell.is_revealed = True
-                                    create_explosion(particles, cell.x * CELL_SIZE + CELL_SIZE // 2, cell.y * CELL_SIZE + CELL_SIZE // 2, RED)
+                        for cell in board:
+                            if cell.is_mine:
+                                cell.is_revealed = True
+                                create_explosion(particles, cell.rect.centerx, cell.rect.centery, RED, pool=particle_pool)
                 elif event.button == 3:  # Right click
-                    if not board[grid_x][grid_y].is_revealed:
-                        board[grid_x][grid_y].is_flagged = not board[grid_x][grid_y].is_flagged
-                        if board[grid_x][grid_y].is_flagged:
-                            board[grid_x][grid_y].animation_timer = 0
+                    if not clicked_cell.is_revealed:
+                        clicked_cell.is_flagged = not clicked_cell.is_flagged
+                        dirty_cells.add((grid_x, grid_y))
 
         # Check for win condition.
         if not game_over and not game_won:
-            revealed_count = sum(c.is_revealed for row in board for c in row)
             if revealed_count == current_grid_size * current_grid_size - current_num_mines:
                 game_won = True
-
-        # Drawing.
-        screen.fill(DARK_GRAY)
-        for x in range(current_grid_size):
-            for y in range(current_grid_size):
-                board[x][y].draw(screen, cell_font)
-        
-        # Update and draw particles
-        for p in particles:
-            p.update()
-        particles = [p for p in particles if p.life > 0]
-        for p in particles:
-            p.draw(screen)
-
-        # Display end game messages.
-        if game_over:
-            draw_end_message(screen, font, "GAME OVER!", RED, level)
-        elif game_won:
-            draw_end_message(screen, font, "YOU WIN!", (0, 255, 0), level, win=True)
-
-        pygame.display.flip()
+                redraw_all = True
+
+        # Drawing. Nothing is redrawn while the board is idle or the window is minimized.
+        if not visible:
+            dirty_cells.clear()
+            continue
+        if redraw_all or particles:
+            # The tiles cover the whole window, so there is no background to clear first.
+            draw_board(screen, board)
+
+            # Update and draw particles
+            update_particles(particles, particle_pool)
+            for p in particles:
+                p.draw(screen)
+
+            # Display end game messages.
+            if game_over:
+                draw_end_message(screen, font, "GAME OVER!", RED, level)
+            elif game_won:
+                draw_end_message(screen, font, "YOU WIN!", (0, 255, 0), level, win=True)
+
+            pygame.display.flip()
+            redraw_all = False
+        elif dirty_cells:
+            changed = [board[x * current_grid_size + y] for x, y in dirty_cells]
+            for cell in changed:
+                cell.draw(screen)
+            pygame.display.update([cell.rect for cell in changed])
+        dirty_cells.clear()
         clock.tick(30)
 
-        if game_over:
-            # Wait for user input to restart or quit
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r: return 'game_over' # Signal to restart current level
-                    if event.key == pygame.K_q: return 'quit'
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mx, my = event.pos
-                    # Check if restart button was clicked
-                    restart_button_rect = pygame.Rect(current_width / 2 - 125, current_height / 2 + 20, 250, 60)
-                    if restart_button_rect.collidepoint(mx, my): return 'game_over'
-                    # Check if quit button was clicked
-                    quit_button_rect = pygame.Rect(current_width / 2 - 125, current_height / 2 + 80, 250, 60)
-                    if quit_button_rect.collidepoint(mx, my): return 'quit'
-        elif game_won:
-            # Wait for user input to proceed or quit
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r: return 'win' # Signal to proceed to next level
-                    if event.key == pygame.K_q: return 'quit'
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mx, my = event.pos
-                    # Check if play again button was clicked
-                    play_again_button_rect = pygame.Rect(current_width / 2 - 125, current_height / 2 + 20, 250, 60)
-                    if play_again_button_rect.collidepoint(mx, my): return 'win'
-                    # Check if quit button was clicked
-                    quit_button_rect = pygame.Rect(current_width / 2 - 125, current_height / 2 + 80, 250, 60)
-                    if quit_button_rect.collidepoint(mx, my): return 'quit'
-
 
 def congratulations_screen(screen, clock, font):
     """
@@ -420,29 +539,35 @@ def congratulations_screen(screen, clock, font):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    title_font = pygame.font.Font(None, 70)
-    score_font = pygame.font.Font(None, 50)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(70)
+    score_font = get_font(50)
+    button_font = get_font(40)
 
-    while True:
-        screen.fill(BACKGROUND_COLOR)
-        draw_text("CONGRATULATIONS!", title_font, HIGHLIGHT_COLOR, screen, WIDTH / 2, HEIGHT / 3 - 50)
-        draw_text(f"You beat Minesweeper!", score_font, TEXT_COLOR, screen, WIDTH / 2, HEIGHT / 3 + 20)
+    # The layout is static, so the button rects and all text are built once before the loop.
+    static_texts = [
+        render_text("CONGRATULATIONS!", title_font, HIGHLIGHT_COLOR, WIDTH / 2, HEIGHT / 3 - 50),
+        render_text("You beat Minesweeper!", score_font, TEXT_COLOR, WIDTH / 2, HEIGHT / 3 + 20),
+    ]
 
-        mx, my = pygame.mouse.get_pos()
+    # Button dimensions and spacing
+    button_width = 250
+    button_height = 60
+
+    back_to_menu_y = HEIGHT / 2 + 100
 
-        # Button dimensions and spacing
-        button_width = 250
-        button_height = 60
-        button_spacing = 20
+    back_to_menu_button_rect = pygame.Rect(WIDTH / 2 - button_width / 2, back_to_menu_y, button_width, button_height)
 
-        back_to_menu_y = HEIGHT / 2 + 100
+    buttons = [
+        {"text": "Back to Menu", "rect": back_to_menu_button_rect, "action": "quit"}
+    ]
+    for button in buttons:
+        button["label"] = render_text(button["text"], button_font, TEXT_COLOR, button["rect"].centerx, button["rect"].centery)
 
-        back_to_menu_button_rect = pygame.Rect(WIDTH / 2 - button_width / 2, back_to_menu_y, button_width, button_height)
+    while True:
+        screen.fill(BACKGROUND_COLOR)
+        screen.blits(static_texts, False)
 
-        buttons = [
-            {"text": "Back to Menu", "rect": back_to_menu_button_rect, "action": "quit"}
-        ]
+        mx, my = pygame.mouse.get_pos()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -457,7 +582,7 @@ def congratulations_screen(screen, clock, font):
             current_button_color = BUTTON_HOVER_COLOR if button["rect"].collidepoint(mx, my) else BUTTON_COLOR
             pygame.draw.rect(screen, current_button_color, button["rect"], border_radius=10)
             pygame.draw.rect(screen, BORDER_COLOR, button["rect"], 2, border_radius=10)
-            draw_text(button["text"], button_font, TEXT_COLOR, screen, button["rect"].centerx, button["rect"].centery)
+            screen.blit(*button["label"])
 
         pygame.display.flip()
         clock.tick(15)
@@ -473,23 +598,24 @@ def run_game(screen, clock):
     from config import LAUNCHER_WIDTH, LAUNCHER_HEIGHT
     pygame.display.set_caption("Minesweeper")
     # Fonts for menus and the game.
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 36)
-    cell_font = pygame.font.Font(None, CELL_SIZE)
+    font = get_font(74)
+    small_font = get_font(36)
+    # The cell numbers are only ever drawn into the cached tiles, so their font is needed just once.
+    if not TILE_CACHE:
+        _build_tile_cache(get_font(CELL_SIZE))
 
     # Main state machine loop.
     while True:
-        screen = pygame.display.set_mode((LAUNCHER_WIDTH, LAUNCHER_HEIGHT))
+        screen = set_display_size((LAUNCHER_WIDTH, LAUNCHER_HEIGHT))
         menu_choice = main_menu(screen, clock, font, small_font)
         if menu_choice == 'quit':
-            screen = pygame.display.set_mode((LAUNCHER_WIDTH, LAUNCHER_HEIGHT))
             return 0
 
         current_level = 1
         game_outcome = None
 
         while current_level <= 5:
-            outcome = game_loop(screen, clock, small_font, cell_font, current_level)
+            outcome = game_loop(screen, clock, small_font, current_level)
 
             if outcome == 'win':
                 current_level += 1
@@ -499,7 +625,7 @@ def run_game(screen, clock):
                 else:
                     # Display level complete message
                     while True:
-                        end_choice = draw_end_message(screen, font, f"Level {current_level - 1} Complete!", (0, 255, 0), current_level, win=True)
+                        draw_end_message(screen, font, f"Level {current_level - 1} Complete!", (0, 255, 0), current_level, win=True)
                         pygame.display.flip()
                         # Wait for user input
                         event = pygame.event.wait()
@@ -514,32 +640,26 @@ def run_game(screen, clock):
                                 break
                         if event.type == pygame.MOUSEBUTTONDOWN:
                             mx, my = event.pos
-                            current_width = screen.get_width()
-                            current_height = screen.get_height()
+                            next_level_button_rect, quit_button_rect = _end_button_rects(screen.get_width(), screen.get_height())
                             # Check if next level button was clicked
-                            next_level_button_rect = pygame.Rect(current_width / 2 - 125, current_height / 2 + 20, 250, 60)
                             if next_level_button_rect.collidepoint(mx, my):
                                 break # Continue to next level
                             # Check if quit button was clicked
-                            quit_button_rect = pygame.Rect(current_width / 2 - 125, current_height / 2 + 80, 250, 60)
                             if quit_button_rect.collidepoint(mx, my):
                                 game_outcome = 'quit'
                                 break
                     if game_outcome == 'quit':
                         break
-            elif outcome == 'game_over':
-                game_outcome = 'game_over'
-                break
+            elif outcome == 'restart':
+                # Replay the level that was just lost.
+                continue
             elif outcome == 'quit':
                 game_outcome = 'quit'
                 break
 
+        # A loss replays the level inside the loop above, so only clearing every level or quitting gets here.
         if game_outcome == 'win':
             congratulations_screen(screen, clock, font)
-        elif game_outcome == 'game_over':
-            end_choice = draw_end_message(screen, font, "GAME OVER!", RED, current_level)
-            if end_choice == 'quit':
-                return 0
         elif game_outcome == 'quit':
             return 0
 
@@ -10,7 +10,7 @@ import sys
 import random
 import math
 from config import BLACK, WHITE, YELLOW, RED, GREEN, GRAY
-from utils import draw_text, pause_menu, settings_menu, Particle, create_explosion
+from utils import render_text, pause_menu, settings_menu, Particle, create_explosion, update_particles, get_particle_sprite, get_font
 import scores
 
 # --- Constants ---
@@ -61,6 +61,243 @@ MAZE = [
     "############################",
 ]
 
+# Movement steps, indexed by direction.
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+# The directions a ghost heading in each direction may take next, in order of preference on ties.
+GHOST_TURNS = ((0, 2, 3), (1, 2, 3), (2, 0, 1), (3, 0, 1))
+
+# Vertical bob of a ghost sprite by animation step, precomputed so drawing does no trig.
+GHOST_BOB = tuple(math.sin(i * 0.2) * 3 for i in range(1024))
+
+# Wall flags indexed as WALLS[y][x], built once so movement checks don't compare maze characters.
+WALLS = tuple(tuple(char == '#' for char in row) for row in MAZE)
+
+def build_exits(walls):
+    """
+    Works out which neighbors of every cell are open, so movement does no wall or edge checks.
+
+    Args:
+        walls (tuple): The wall flags of the maze, indexed as walls[y][x].
+
+    Returns:
+        tuple: Indexed as exits[y][x], a bitmap with bit `direction` set when that step is open.
+    """
+    exits = []
+    for y, row in enumerate(walls):
+        row_exits = []
+        for x in range(len(row)):
+            bits = 0
+            for direction, (dx, dy) in enumerate(DIRECTIONS):
+                ny = y + dy
+                # The side tunnel wraps around, so horizontal neighbors are looked up modulo the maze width.
+                if 0 <= ny < len(walls) and not walls[ny][(x + dx) % MAZE_WIDTH]:
+                    bits |= 1 << direction
+            row_exits.append(bits)
+        exits.append(tuple(row_exits))
+    return tuple(exits)
+
+EXITS = build_exits(WALLS)
+
+# What a cell of the pellet grid holds.
+NO_PELLET, PELLET, POWER_PELLET = 0, 1, 2
+
+def build_ghost_moves(exits):
+    """
+    Works out every move a ghost could make from every cell, so ghost AI does no wall checks per tick.
+
+    A ghost never reverses, so from each heading it picks between carrying on and the two
+    perpendicular turns. Only the open ones are kept, in order of preference on ties.
+
+    Args:
+        exits (tuple): The open-neighbor bitmaps of the maze, as built by `build_exits`.
+
+    Returns:
+        tuple: Indexed as moves[y][x][direction], each a tuple of (direction, nx, ny) options.
+            nx is not wrapped, so distances across the side tunnel match the unwrapped step.
+    """
+    moves = []
+    for y, row in enumerate(exits):
+        row_moves = []
+        for x, bits in enumerate(row):
+            cell_moves = []
+            for turns in GHOST_TURNS:
+                options = []
+                for direction in turns:
+                    if bits & (1 << direction):
+                        dx, dy = DIRECTIONS[direction]
+                        options.append((direction, x + dx, y + dy))
+                cell_moves.append(tuple(options))
+            row_moves.append(tuple(cell_moves))
+        moves.append(tuple(row_moves))
+    return tuple(moves)
+
+GHOST_MOVES = build_ghost_moves(EXITS)
+
+def move_ghosts(ghosts, player_pos):
+    """
+    Moves every ghost one cell, all in a single pass.
+
+    Simple AI: each ghost takes the first of its open options that is closest to the player,
+    and keeps its heading if none are open.
+
+    Args:
+        ghosts (list): The ghosts to move.
+        player_pos (tuple): The current position of the player.
+
+    Returns:
+        list: The new (x, y) cell of every ghost, for the collision check.
+    """
+    px, py = player_pos
+    ghost_moves = GHOST_MOVES
+    cells = []
+    for ghost in ghosts:
+        options = ghost_moves[ghost.y][ghost.x][ghost.direction]
+        if options:
+            best = options[0]
+            best_dist = abs(best[1] - px) + abs(best[2] - py)
+            for option in options[1:]:
+                dist = abs(option[1] - px) + abs(option[2] - py)
+                if dist < best_dist:
+                    best, best_dist = option, dist
+            ghost.direction, nx, ghost.y = best
+            ghost.x = nx % MAZE_WIDTH
+        else:
+            dx, dy = DIRECTIONS[ghost.direction]
+            ghost.x = (ghost.x + dx) % MAZE_WIDTH
+            ghost.y += dy
+        ghost.animation_timer += 1
+        cells.append((ghost.x, ghost.y))
+    return cells
+
+def set_game_mode():
+    """
+    Opens the Pac-Man window through SDL's renderer, with vsync so flips line up with the display refresh.
+
+    Falls back to a plain window on drivers that cannot create a vsynced renderer.
+
+    Returns:
+        pygame.Surface: The display surface.
+    """
+    try:
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+    except pygame.error:
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+def create_maze_background():
+    """
+    Draws the black background and the maze walls once. Must be called after a display mode is set.
+
+    Returns:
+        pygame.Surface: The maze background, in the display's pixel format.
+    """
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    background.fill(BLACK)
+    for y, row in enumerate(WALLS):
+        for x, is_wall in enumerate(row):
+            if is_wall:
+                pygame.draw.rect(background, (0, 0, 180), (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
+    return background
+
+def create_pellet_grid():
+    """
+    Scans the maze layout for pellets.
+
+    Returns:
+        bytearray: The pellet in each cell (NO_PELLET, PELLET or POWER_PELLET), indexed as
+            grid[y * MAZE_WIDTH + x].
+    """
+    grid = bytearray(MAZE_WIDTH * MAZE_HEIGHT)
+    for y, row in enumerate(MAZE):
+        for x, char in enumerate(row):
+            if char == '.':
+                grid[y * MAZE_WIDTH + x] = PELLET
+            elif char == 'o':
+                grid[y * MAZE_WIDTH + x] = POWER_PELLET
+    return grid
+
+# The maze layout is fixed, so the start positions and pellet layout are found once at import.
+PLAYER_START = next((x, y) for y, row in enumerate(MAZE) for x, char in enumerate(row) if char == 'P')
+GHOST_STARTS = tuple((x, y) for y, row in enumerate(MAZE) for x, char in enumerate(row) if char == 'G')
+INITIAL_PELLET_GRID = bytes(create_pellet_grid())
+INITIAL_PELLET_COUNT = len(INITIAL_PELLET_GRID) - INITIAL_PELLET_GRID.count(NO_PELLET)
+
+def create_board_surface(maze_background, pellet_grid):
+    """
+    Draws the remaining pellets over a copy of the maze background.
+
+    Eaten pellets are cleared from the returned surface with `clear_cell`, so the maze and
+    pellets are a single blit per frame.
+
+    Args:
+        maze_background (pygame.Surface): The pre-drawn maze.
+        pellet_grid (bytearray): The pellet in each cell, as built by `create_pellet_grid`.
+
+    Returns:
+        pygame.Surface: The maze with its pellets drawn on.
+    """
+    board = maze_background.copy()
+    for cell, pellet in enumerate(pellet_grid):
+        if pellet:
+            y, x = divmod(cell, MAZE_WIDTH)
+            center = (x * CELL_SIZE + CELL_SIZE // 2, y * CELL_SIZE + CELL_SIZE // 2)
+            if pellet == POWER_PELLET:
+                pygame.draw.circle(board, GREEN, center, 5)
+            else:
+                pygame.draw.circle(board, WHITE, center, 2)
+    return board
+
+def clear_cell(board, x, y):
+    """Erases whatever was drawn in an open (non-wall) cell of the board surface."""
+    board.fill(BLACK, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+
+# Burnt-out trail and explosion particles, handed back out by spawn_trail and create_explosion.
+particle_pool = []
+
+def spawn_trail(particles, x, y):
+    """Adds a trail particle at the centre of cell (x, y), recycling one from the pool when available."""
+    px, py = x * CELL_SIZE + CELL_SIZE // 2, y * CELL_SIZE + CELL_SIZE // 2
+    if particle_pool:
+        particle = particle_pool.pop()
+        particle.reset(px, py, YELLOW, 3, 10, 0, 0)
+    else:
+        particle = Particle(px, py, YELLOW, 3, 10, 0, 0)
+    particles.append(particle)
+
+# Sprites are loaded and scaled once per file and variant, then shared by every instance that uses them.
+_SPRITE_CACHE = {}
+
+def get_sprite(name, alpha=None):
+    """
+    Returns a sprite from assets/sprites scaled to one cell, loading it on first use.
+
+    Args:
+        name (str): The sprite's file name.
+        alpha (int, optional): A surface-wide alpha to draw the sprite with. Defaults to None.
+
+    Returns:
+        pygame.Surface: The shared sprite surface.
+    """
+    key = (name, alpha)
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        sprite = pygame.image.load(f'assets/sprites/{name}').convert_alpha()
+        sprite = pygame.transform.scale(sprite, (CELL_SIZE, CELL_SIZE))
+        if alpha is not None:
+            sprite.set_alpha(alpha)
+        _SPRITE_CACHE[key] = sprite
+    return sprite
+
+def draw_sprites(screen, player, ghosts, particles):
+    """Draws the player, the ghosts and then every live particle with one batched blit, returning the drawn rects."""
+    draws = [player.get_blit()]
+    draws += [ghost.get_blit() for ghost in ghosts]
+    for p in particles:
+        radius = int(p.size)
+        if p.life > 0 and radius > 0:
+            draws.append((get_particle_sprite(p.color, radius), (int(p.x) - radius, int(p.y) - radius)))
+    return screen.blits(draws)
+
 class Ghost:
     """
     Represents a ghost in the Pac-Man game.
@@ -76,85 +313,20 @@ class Ghost:
         """
         self.x, self.y = x, y
         self.color = color
-        self.direction = random.choice(['UP', 'DOWN', 'LEFT', 'RIGHT'])
-        # Load the ghost sprite.
-        self.sprite = pygame.image.load(f'assets/sprites/{color}').convert_alpha()
-        self.sprite = pygame.transform.scale(self.sprite, (CELL_SIZE, CELL_SIZE))
+        self.direction = random.randrange(len(DIRECTIONS))
+        # Ghosts are always drawn translucent.
+        self.sprite = get_sprite(color, 180)
         self.animation_timer = 0
 
-    def move(self, maze, player_pos):
-        """
-        Moves the ghost within the maze.
-
-        Args:
-            maze (list): The maze layout.
-            player_pos (tuple): The current position of the player.
+    def get_blit(self):
         """
-        # Simple AI: try to move towards the player.
-        options = []
-        if self.direction == 'UP':
-            options = ['UP', 'LEFT', 'RIGHT']
-        elif self.direction == 'DOWN':
-            options = ['DOWN', 'LEFT', 'RIGHT']
-        elif self.direction == 'LEFT':
-            options = ['LEFT', 'UP', 'DOWN']
-        elif self.direction == 'RIGHT':
-            options = ['RIGHT', 'UP', 'DOWN']
-
-        valid_moves = []
-        for move in options:
-            if move == 'UP' and maze[self.y - 1][self.x] != '#':
-                valid_moves.append(move)
-            if move == 'DOWN' and maze[self.y + 1][self.x] != '#':
-                valid_moves.append(move)
-            if move == 'LEFT' and maze[self.y][self.x - 1] != '#':
-                valid_moves.append(move)
-            if move == 'RIGHT' and maze[self.y][self.x + 1] != '#':
-                valid_moves.append(move)
-
-        if valid_moves:
-            # Prioritize moves that get closer to the player.
-            best_move = self.direction
-            min_dist = float('inf')
-
-            for move in valid_moves:
-                if move == 'UP':
-                    dist = abs(self.x - player_pos[0]) + abs(self.y - 1 - player_pos[1])
-                elif move == 'DOWN':
-                    dist = abs(self.x - player_pos[0]) + abs(self.y + 1 - player_pos[1])
-                elif move == 'LEFT':
-                    dist = abs(self.x - 1 - player_pos[0]) + abs(self.y - player_pos[1])
-                elif move == 'RIGHT':
-                    dist = abs(self.x + 1 - player_pos[0]) + abs(self.y - player_pos[1])
-                
-                if dist < min_dist:
-                    min_dist = dist
-                    best_move = move
-            
-            self.direction = best_move
-
-        # Move the ghost in the chosen direction.
-        if self.direction == 'UP':
-            self.y -= 1
-        elif self.direction == 'DOWN':
-            self.y += 1
-        elif self.direction == 'LEFT':
-            self.x -= 1
-        elif self.direction == 'RIGHT':
-            self.x += 1
-        
-        self.animation_timer += 1
+        Returns what draws the ghost, for a batched blits() call.
 
-    def draw(self, screen):
+        Returns:
+            tuple: The (sprite, position) pair.
         """
-        Draws the ghost on the screen.
-
-        Args:
-            screen (pygame.Surface): The screen to draw on.
-        """
-        offset_y = math.sin(self.animation_timer * 0.2) * 3
-        self.sprite.set_alpha(180)
-        screen.blit(self.sprite, (self.x * CELL_SIZE, self.y * CELL_SIZE + offset_y))
+        offset_y = GHOST_BOB[self.animation_timer & 1023]
+        return self.sprite, (self.x * CELL_SIZE, self.y * CELL_SIZE + offset_y)
 
 class Player:
     """
@@ -170,37 +342,71 @@ class Player:
         """
         self.x, self.y = x, y
         self.dx, self.dy = 0, 0
-        # Load the player sprite.
-        self.sprite = pygame.image.load('assets/sprites/pacman.png').convert_alpha()
-        self.sprite = pygame.transform.scale(self.sprite, (CELL_SIZE, CELL_SIZE))
+        self.sprite = get_sprite('pacman.png')
+        # The sprite spins in 10 degree steps, so all 36 rotations are made once up front.
+        self.rotated_sprites = [pygame.transform.rotate(self.sprite, angle) for angle in range(0, 360, 10)]
         self.animation_timer = 0
 
-    def move(self, dx, dy, maze):
+    def move(self, direction):
         """
         Moves the player within the maze.
 
         Args:
-            dx (int): The change in the x-coordinate.
-            dy (int): The change in the y-coordinate.
-            maze (list): The maze layout.
+            direction (int): The direction to step in, or None to stand still.
+
+        Returns:
+            bool: True if the player moved to a new cell.
         """
-        new_x, new_y = self.x + dx, self.y + dy
-        # Check for wall collisions.
-        if 0 <= new_x < MAZE_WIDTH and 0 <= new_y < MAZE_HEIGHT and maze[new_y][new_x] != '#':
-            self.x, self.y = new_x, new_y
-        
         self.animation_timer += 1
-
-    def draw(self, screen):
+        # Check for wall collisions.
+        if direction is None or not EXITS[self.y][self.x] & (1 << direction):
+            return False
+        dx, dy = DIRECTIONS[direction]
+        # The side tunnel wraps around to the other edge of the maze.
+        self.x = (self.x + dx) % MAZE_WIDTH
+        self.y += dy
+        return True
+
+    def get_blit(self):
         """
-        Draws the player on the screen.
+        Returns what draws the player, for a batched blits() call.
 
-        Args:
-            screen (pygame.Surface): The screen to draw on.
+        Returns:
+            tuple: The (sprite, position) pair.
         """
-        angle = (self.animation_timer * 10) % 360
-        rotated_sprite = pygame.transform.rotate(self.sprite, angle)
-        screen.blit(rotated_sprite, (self.x * CELL_SIZE, self.y * CELL_SIZE))
+        rotated_sprite = self.rotated_sprites[self.animation_timer % len(self.rotated_sprites)]
+        return rotated_sprite, (self.x * CELL_SIZE, self.y * CELL_SIZE)
+
+def find_hovered(buttons, pos):
+    """Returns the menu button under `pos`, or None."""
+    for button in buttons:
+        if button["rect"].collidepoint(pos):
+            return button
+    return None
+
+def draw_menu_screen(screen, title_text, buttons, hovered, background_color, button_color, hover_color, border_color):
+    """
+    Draws a full menu screen and flips it to the display.
+
+    Args:
+        screen (pygame.Surface): The screen to draw on.
+        title_text (tuple): The pre-rendered (surface, rect) title.
+        buttons (list): The menu buttons, each with a "rect" and a pre-rendered "label".
+        hovered (dict): The button under the mouse, drawn highlighted, or None.
+        background_color (tuple): The screen's fill color.
+        button_color (tuple): The fill of buttons that are not hovered.
+        hover_color (tuple): The fill of the hovered button.
+        border_color (tuple): The button outline color.
+    """
+    screen.fill(background_color)
+    screen.blit(*title_text)
+    # Draw buttons with hover effects.
+    for button in buttons:
+        current_button_color = hover_color if button is hovered else button_color
+        pygame.draw.rect(screen, current_button_color, button["rect"], border_radius=10)
+        pygame.draw.rect(screen, border_color, button["rect"], 2, border_radius=10)
+        screen.blit(*button["label"])
+    pygame.display.flip()
 
 def main_menu(screen, clock, font, small_font):
     """
@@ -223,54 +429,60 @@ def main_menu(screen, clock, font, small_font):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    # Main loop for the menu.
-    while True:
-        screen.fill(BACKGROUND_COLOR)
-        draw_text("Pac-Man", font, HIGHLIGHT_COLOR, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 4)
+    # The layout is static, so the button rects and all text are built once before the loop.
+    title_text = render_text("Pac-Man", font, HIGHLIGHT_COLOR, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 4)
 
-        mx, my = pygame.mouse.get_pos()
+    # Define button properties.
+    button_width = 250
+    button_height = 60
+    button_spacing = 20
 
-        # Define button properties.
-        button_width = 250
-        button_height = 60
-        button_spacing = 20
+    settings_y = SCREEN_HEIGHT / 2 - 50
+    start_y = settings_y + button_height + button_spacing
+    quit_y = start_y + button_height + button_spacing
 
-        settings_y = SCREEN_HEIGHT / 2 - 50
-        start_y = settings_y + button_height + button_spacing
-        quit_y = start_y + button_height + button_spacing
+    settings_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, settings_y, button_width, button_height)
+    start_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, start_y, button_width, button_height)
+    quit_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, quit_y, button_width, button_height)
 
-        settings_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, settings_y, button_width, button_height)
-        start_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, start_y, button_width, button_height)
-        quit_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, quit_y, button_width, button_height)
+    buttons = [
+        {"text": "Settings", "rect": settings_button_rect, "action": "settings"},
+        {"text": "Start Game", "rect": start_button_rect, "action": "play"},
+        {"text": "Back to Menu", "rect": quit_button_rect, "action": "quit"}
+    ]
+    for button in buttons:
+        button["label"] = render_text(button["text"], small_font, TEXT_COLOR, button["rect"].centerx, button["rect"].centery)
 
-        buttons = [
-            {"text": "Settings", "rect": settings_button_rect, "action": "settings"},
-            {"text": "Start Game", "rect": start_button_rect, "action": "play"},
-            {"text": "Back to Menu", "rect": quit_button_rect, "action": "quit"}
-        ]
+    # Main loop for the menu. It only repaints when the hovered button changes or the screen was covered.
+    hovered = find_hovered(buttons, pygame.mouse.get_pos())
+    dirty = True
+    while True:
+        if dirty:
+            draw_menu_screen(screen, title_text, buttons, hovered, BACKGROUND_COLOR, BUTTON_COLOR, BUTTON_HOVER_COLOR, BORDER_COLOR)
+            dirty = False
 
         # Event handling for the menu.
-        for event in pygame.event.get():
+        # Sleep until input arrives instead of redrawing at a fixed rate; the timeout keeps the loop responsive.
+        for event in [pygame.event.wait(66)] + pygame.event.get():
             if event.type == pygame.QUIT:
                 return 'quit'
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEMOTION:
+                new_hovered = find_hovered(buttons, event.pos)
+                if new_hovered is not hovered:
+                    hovered = new_hovered
+                    dirty = True
+            elif event.type == pygame.MOUSEBUTTONDOWN:
                 for button in buttons:
                     if button["rect"].collidepoint(event.pos):
                         if button["action"] == "settings":
                             new_volume, status = settings_menu(screen, clock, SCREEN_WIDTH, SCREEN_HEIGHT, pygame.mixer.music.get_volume())
                             if status == 'quit': return 'quit'
+                            hovered = find_hovered(buttons, pygame.mouse.get_pos())
+                            dirty = True
                         else:
                             return button["action"]
-
-        # Draw buttons with hover effects.
-        for button in buttons:
-            current_button_color = BUTTON_HOVER_COLOR if button["rect"].collidepoint(mx, my) else BUTTON_COLOR
-            pygame.draw.rect(screen, current_button_color, button["rect"], border_radius=10)
-            pygame.draw.rect(screen, BORDER_COLOR, button["rect"], 2, border_radius=10)
-            draw_text(button["text"], small_font, TEXT_COLOR, screen, button["rect"].centerx, button["rect"].centery)
-
-        pygame.display.flip()
-        clock.tick(15)
+            elif event.type == pygame.WINDOWEXPOSED:
+                dirty = True
 
 def game_loop(screen, clock, font):
     """
@@ -285,31 +497,25 @@ def game_loop(screen, clock, font):
         int: The final score of the player.
     """
     pygame.display.set_caption("Pac-Man")
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    font = pygame.font.Font(None, 36)
+    screen = set_game_mode()
+    font = get_font(36)
+    # The maze never changes, so it is drawn once and blitted every frame.
+    maze_background = create_maze_background()
 
-    # Find the starting position of the player in the maze.
-    player_start_pos = next(((x, y) for y, row in enumerate(MAZE) for x, char in enumerate(row) if char == 'P'))
-    player = Player(*player_start_pos)
-
-    # Find the starting positions of the ghosts in the maze.
-    ghost_start_pos = [(x, y) for y, row in enumerate(MAZE) for x, char in enumerate(row) if char == 'G']
+    player = Player(*PLAYER_START)
     ghosts = [
-        Ghost(ghost_start_pos[0][0], ghost_start_pos[0][1], 'ghost_red.png'),
-        Ghost(ghost_start_pos[1][0], ghost_start_pos[1][1], 'ghost_pink.png'),
-        Ghost(ghost_start_pos[2][0], ghost_start_pos[2][1], 'ghost_cyan.png'),
-        Ghost(ghost_start_pos[3][0], ghost_start_pos[3][1], 'ghost_orange.png')
+        Ghost(GHOST_STARTS[0][0], GHOST_STARTS[0][1], 'ghost_red.png'),
+        Ghost(GHOST_STARTS[1][0], GHOST_STARTS[1][1], 'ghost_pink.png'),
+        Ghost(GHOST_STARTS[2][0], GHOST_STARTS[2][1], 'ghost_cyan.png'),
+        Ghost(GHOST_STARTS[3][0], GHOST_STARTS[3][1], 'ghost_orange.png')
     ]
 
-    # Create sets of pellets and power pellets from the maze layout.
-    pellets = set()
-    power_pellets = set()
-    for y, row in enumerate(MAZE):
-        for x, char in enumerate(row):
-            if char == '.':
-                pellets.add((x, y))
-            elif char == 'o':
-                power_pellets.add((x, y))
+    # Track the pellets in a flat grid, with a running count of those left for the win check.
+    pellet_grid = bytearray(INITIAL_PELLET_GRID)
+    pellets_left = INITIAL_PELLET_COUNT
+    # A fresh board is kept so a restart only has to copy it.
+    initial_board = create_board_surface(maze_background, pellet_grid)
+    board = initial_board.copy()
 
     # Initialize game state variables.
     score = 0
@@ -317,11 +523,19 @@ def game_loop(screen, clock, font):
     game_over = False
     particles = []
 
-    # Timer for controlling movement speed.
-    move_timer = 0
-    move_interval = 8  # Lower is faster.
+    # Game logic advances in fixed steps of wall-clock time, independent of the frame rate.
+    move_step = 8 * 1000 / 60  # Milliseconds per move; lower is faster.
+    accumulator = 0
 
-    dx, dy = 0, 0
+    # The player stands still until the first arrow key is pressed.
+    direction = None
+    # Set whenever the frame on screen is out of date.
+    dirty = True
+    # Set when the whole screen must be redrawn, rather than only the areas sprites and the HUD cover.
+    full_redraw = True
+    drawn_rects = []
+    # The UI text is only re-rendered when the value it shows changes.
+    shown_score = shown_lives = None
 
     # Main game loop.
     running = True
@@ -332,115 +546,123 @@ def game_loop(screen, clock, font):
                 return score
             if event.type == pygame.KEYDOWN:
                 # Change player direction based on key presses.
-                if event.key == pygame.K_LEFT: dx, dy = -1, 0
-                elif event.key == pygame.K_RIGHT: dx, dy = 1, 0
-                elif event.key == pygame.K_UP: dx, dy = 0, -1
-                elif event.key == pygame.K_DOWN: dx, dy = 0, 1
+                if event.key == pygame.K_LEFT: direction = LEFT
+                elif event.key == pygame.K_RIGHT: direction = RIGHT
+                elif event.key == pygame.K_UP: direction = UP
+                elif event.key == pygame.K_DOWN: direction = DOWN
                 elif event.key == pygame.K_p:
                     # Pause the game.
                     pause_choice = pause_menu(screen, clock, SCREEN_WIDTH, SCREEN_HEIGHT)
                     if pause_choice == 'quit':
                         return score
+                    dirty = full_redraw = True
                 elif event.key == pygame.K_s:
                     # Open the settings menu.
                     new_volume, status = settings_menu(screen, clock, SCREEN_WIDTH, SCREEN_HEIGHT, pygame.mixer.music.get_volume())
                     if status == 'quit': return score
+                    dirty = full_redraw = True
                 elif event.key == pygame.K_q and game_over:
                     return score
-
-        if not game_over:
-            # Move player and ghosts based on the move timer.
-            move_timer += 1
-            if move_timer >= move_interval:
-                player.move(dx, dy, MAZE)
-                for ghost in ghosts:
-                    ghost.move(MAZE, (player.x, player.y))
-                move_timer = 0
-
-            # Check for pellet collision.
-            if (player.x, player.y) in pellets:
-                pellets.remove((player.x, player.y))
-                score += 10
-                create_explosion(particles, player.x * CELL_SIZE + CELL_SIZE // 2, player.y * CELL_SIZE + CELL_SIZE // 2, (255, 255, 255), 5)
-
-            # Check for power pellet collision.
-            if (player.x, player.y) in power_pellets:
-                power_pellets.remove((player.x, player.y))
-                score += 50
-                create_explosion(particles, player.x * CELL_SIZE + CELL_SIZE // 2, player.y * CELL_SIZE + CELL_SIZE // 2, (0, 255, 0), 20)
-
-            # Check for ghost collision.
-            for ghost in ghosts:
-                if player.x == ghost.x and player.y == ghost.y:
-                    lives -= 1
-                    create_explosion(particles, player.x * CELL_SIZE + CELL_SIZE // 2, player.y * CELL_SIZE + CELL_SIZE // 2, (255, 0, 0), 30)
-                    if lives <= 0:
-                        game_over = True
-                    else:
-                        # Reset player and ghost positions.
-                        player.x, player.y = player_start_pos
-                        for i, g in enumerate(ghosts):
-                            g.x, g.y = ghost_start_pos[i]
+            elif event.type == pygame.WINDOWEXPOSED:
+                dirty = full_redraw = True
+
+        # Positions only change on a move step, so pellet and collision checks run only then.
+        while not game_over and accumulator >= move_step:
+            accumulator -= move_step
+            dirty = True
+            # Leave a trail only when the player actually moves.
+            if player.move(direction):
+                spawn_trail(particles, player.x, player.y)
+            ghost_cells = move_ghosts(ghosts, (player.x, player.y))
+
+            # Check for pellet and power pellet collision.
+            cell = player.y * MAZE_WIDTH + player.x
+            pellet = pellet_grid[cell]
+            if pellet:
+                pellet_grid[cell] = NO_PELLET
+                pellets_left -= 1
+                clear_cell(board, player.x, player.y)
+                if pellet == POWER_PELLET:
+                    score += 50
+                    create_explosion(particles, player.x * CELL_SIZE + CELL_SIZE // 2, player.y * CELL_SIZE + CELL_SIZE // 2, (0, 255, 0), 20, pool=particle_pool)
+                else:
+                    score += 10
+                    create_explosion(particles, player.x * CELL_SIZE + CELL_SIZE // 2, player.y * CELL_SIZE + CELL_SIZE // 2, (255, 255, 255), 5, pool=particle_pool)
+
+            # Check for ghost collision. Ghosts sharing the player's cell cost a single life.
+            if (player.x, player.y) in ghost_cells:
+                lives -= 1
+                create_explosion(particles, player.x * CELL_SIZE + CELL_SIZE // 2, player.y * CELL_SIZE + CELL_SIZE // 2, (255, 0, 0), 30, pool=particle_pool)
+                if lives <= 0:
+                    game_over = True
+                else:
+                    # Reset player and ghost positions.
+                    player.x, player.y = PLAYER_START
+                    for i, g in enumerate(ghosts):
+                        g.x, g.y = GHOST_STARTS[i]
 
             # Check for win condition.
-            if not pellets and not power_pellets:
+            if not pellets_left:
                 game_over = True
 
         # Update particles
-        for p in particles:
-            p.update()
-        particles = [p for p in particles if p.life > 0]
-        particles.append(Particle(player.x * CELL_SIZE + CELL_SIZE // 2, player.y * CELL_SIZE + CELL_SIZE // 2, YELLOW, 3, 10, 0, 0))
+        if particles:
+            update_particles(particles, particle_pool)
+            dirty = True
+
+        if not dirty:
+            # Nothing changed since the last frame, so there is nothing to redraw.
+            accumulator = min(accumulator + clock.tick(60), move_step * 2)
+            continue
+        dirty = False
 
         # --- Drawing ---
-        screen.fill(BLACK)
-
-        # Draw the maze.
-        for y, row in enumerate(MAZE):
-            for x, char in enumerate(row):
-                if char == '#':
-                    pygame.draw.rect(screen, (0, 0, 180), (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
-
-        # Draw pellets and power pellets.
-        for x, y in pellets:
-            pygame.draw.circle(screen, WHITE, (x * CELL_SIZE + CELL_SIZE // 2, y * CELL_SIZE + CELL_SIZE // 2), 2)
-        for x, y in power_pellets:
-            pygame.draw.circle(screen, GREEN, (x * CELL_SIZE + CELL_SIZE // 2, y * CELL_SIZE + CELL_SIZE // 2), 5)
-
-        # Draw player and ghosts.
-        player.draw(screen)
-        for ghost in ghosts:
-            ghost.draw(screen)
-        
-        for p in particles:
-            p.draw(screen)
+        if full_redraw:
+            # Draw the maze and the remaining pellets.
+            screen.blit(board, (0, 0))
+        else:
+            # Erase last frame's sprites and UI by restoring the board underneath them.
+            screen.blits([(board, rect, rect) for rect in drawn_rects], False)
+
+        # Draw player, ghosts and particles.
+        sprite_rects = draw_sprites(screen, player, ghosts, particles)
 
         # Draw the UI (score and lives).
-        draw_text(f"Score: {score}", font, WHITE, screen, 60, 10)
-        draw_text(f"Lives: {lives}", font, WHITE, screen, SCREEN_WIDTH - 60, 10)
+        if score != shown_score:
+            shown_score = score
+            score_text = render_text(f"Score: {score}", font, WHITE, 60, 10)
+        if lives != shown_lives:
+            shown_lives = lives
+            lives_text = render_text(f"Lives: {lives}", font, WHITE, SCREEN_WIDTH - 60, 10)
+        sprite_rects.append(screen.blit(*score_text))
+        sprite_rects.append(screen.blit(*lives_text))
 
         if game_over:
             end_choice = end_screen(screen, clock, font, f"GAME OVER")
             if end_choice == 'quit':
                 return score
             # Restart the game.
-            player.x, player.y = player_start_pos
+            player.x, player.y = PLAYER_START
             for i, g in enumerate(ghosts):
-                g.x, g.y = ghost_start_pos[i]
-            pellets = set()
-            power_pellets = set()
-            for y, row in enumerate(MAZE):
-                for x, char in enumerate(row):
-                    if char == '.':
-                        pellets.add((x, y))
-                    elif char == 'o':
-                        power_pellets.add((x, y))
+                g.x, g.y = GHOST_STARTS[i]
+            pellet_grid = bytearray(INITIAL_PELLET_GRID)
+            pellets_left = INITIAL_PELLET_COUNT
+            board = initial_board.copy()
             score = 0
             lives = 3
             game_over = False
-
-        pygame.display.flip()
-        clock.tick(60)
+            dirty = full_redraw = True
+            continue
+
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        else:
+            # Only the areas erased or drawn this frame changed on screen.
+            pygame.display.update(drawn_rects + sprite_rects)
+        drawn_rects = sprite_rects
+        # Time spent in menus is not caught up on, so at most one extra step runs after a pause.
+        accumulator = min(accumulator + clock.tick(60), move_step * 2)
 
     return score
 
@@ -466,50 +688,54 @@ def end_screen(screen, clock, font, message):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    title_font = pygame.font.Font(None, 60)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(60)
+    button_font = get_font(40)
 
-    # Main loop for the end screen.
-    while True:
-        screen.fill(BACKGROUND_COLOR)
-        draw_text(message, title_font, HIGHLIGHT_COLOR, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3)
+    # The layout is static, so the button rects and all text are built once before the loop.
+    title_text = render_text(message, title_font, HIGHLIGHT_COLOR, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3)
 
-        mx, my = pygame.mouse.get_pos()
+    # Define button properties.
+    button_width = 250
+    button_height = 60
+    button_spacing = 20
 
-        # Define button properties.
-        button_width = 250
-        button_height = 60
-        button_spacing = 20
+    play_again_y = SCREEN_HEIGHT / 2 + 20
+    quit_y = play_again_y + button_height + button_spacing
 
-        play_again_y = SCREEN_HEIGHT / 2 + 20
-        quit_y = play_again_y + button_height + button_spacing
+    play_again_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, play_again_y, button_width, button_height)
+    quit_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, quit_y, button_width, button_height)
 
-        play_again_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, play_again_y, button_width, button_height)
-        quit_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, quit_y, button_width, button_height)
+    buttons = [
+        {"text": "Play Again", "rect": play_again_button_rect, "action": "play_again"},
+        {"text": "Back to Menu", "rect": quit_button_rect, "action": "quit"}
+    ]
+    for button in buttons:
+        button["label"] = render_text(button["text"], button_font, TEXT_COLOR, button["rect"].centerx, button["rect"].centery)
 
-        buttons = [
-            {"text": "Play Again", "rect": play_again_button_rect, "action": "play_again"},
-            {"text": "Back to Menu", "rect": quit_button_rect, "action": "quit"}
-        ]
+    # Main loop for the end screen. It only repaints when the hovered button changes or the screen was covered.
+    hovered = find_hovered(buttons, pygame.mouse.get_pos())
+    dirty = True
+    while True:
+        if dirty:
+            draw_menu_screen(screen, title_text, buttons, hovered, BACKGROUND_COLOR, BUTTON_COLOR, BUTTON_HOVER_COLOR, BORDER_COLOR)
+            dirty = False
 
         # Event handling for the end screen.
-        for event in pygame.event.get():
+        # Sleep until input arrives instead of redrawing at a fixed rate; the timeout keeps the loop responsive.
+        for event in [pygame.event.wait(66)] + pygame.event.get():
             if event.type == pygame.QUIT:
                 return 'quit'
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEMOTION:
+                new_hovered = find_hovered(buttons, event.pos)
+                if new_hovered is not hovered:
+                    hovered = new_hovered
+                    dirty = True
+            elif event.type == pygame.MOUSEBUTTONDOWN:
                 for button in buttons:
                     if button["rect"].collidepoint(event.pos):
                         return button["action"]
-
-        # Draw buttons with hover effects.
-        for button in buttons:
-            current_button_color = BUTTON_HOVER_COLOR if button["rect"].collidepoint(mx, my) else BUTTON_COLOR
-            pygame.draw.rect(screen, current_button_color, button["rect"], border_radius=10)
-            pygame.draw.rect(screen, BORDER_COLOR, button["rect"], 2, border_radius=10)
-            draw_text(button["text"], button_font, TEXT_COLOR, screen, button["rect"].centerx, button["rect"].centery)
-
-        pygame.display.flip()
-        clock.tick(15)
+            elif event.type == pygame.WINDOWEXPOSED:
+                dirty = True
 
 def run_game(screen, clock):
     """
@@ -519,8 +745,8 @@ def run_game(screen, clock):
         screen (pygame.Surface): The main screen surface.
         clock (pygame.time.Clock): The Pygame clock object.
     """
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 36)
+    font = get_font(74)
+    small_font = get_font(36)
     # Main state machine loop.
     while True:
         menu_choice = main_menu(screen, clock, font, small_font)
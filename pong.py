@@ -8,10 +8,11 @@ ball physics, and scoring. It also features a main menu and an end screen.
 import pygame
 import sys
 import random
+from collections import deque
 
 # Import shared modules and constants.
 from config import BLACK, WHITE, DEFAULT_MUSIC_VOLUME
-from utils import draw_text, pause_menu, settings_menu, Particle, ScreenShaker, create_explosion
+from utils import draw_text, render_text, pause_menu, settings_menu, ScreenShaker, create_explosion, update_particles, get_font
 import scores
 
 # --- Initialization ---
@@ -28,9 +29,46 @@ BALL_SIZE = 15
 # Paddle speeds.
 PADDLE_SPEED = 7
 AI_PADDLE_SPEED = 6
+# The fastest the ball may travel per frame on either axis. Below PADDLE_WIDTH + BALL_SIZE the
+# ball cannot step clean over a paddle between two frames.
+MAX_BALL_SPEED = PADDLE_WIDTH + BALL_SIZE - 1
 # The score required to win the game.
 WINNING_SCORE = 5
 
+# --- Events ---
+# The only event types the menus react to. Anything else left in the queue
+# is picked up by the next pygame.event.wait() call.
+MENU_EVENTS = (pygame.QUIT, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED)
+# Event types nothing in the game loop reads, blocked while it runs.
+GAME_IGNORED_EVENTS = [pygame.MOUSEMOTION, pygame.ACTIVEEVENT]
+
+def set_game_mode():
+    """
+    Opens the Pong window through SDL's renderer, with vsync so flips line up with the display refresh.
+
+    Falls back to a plain window on drivers that cannot create a vsynced renderer.
+
+    Returns:
+        pygame.Surface: The display surface.
+    """
+    try:
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+    except pygame.error:
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+def find_hovered(buttons, pos):
+    """Returns the menu button under `pos`, or None."""
+    for button in buttons:
+        if button["rect"].collidepoint(pos):
+            return button
+    return None
+
+def draw_button(surface, button, color, border_color):
+    """Draws a menu button filled with `color`, outlined with `border_color`, and its pre-rendered label."""
+    pygame.draw.rect(surface, color, button["rect"], border_radius=10)
+    pygame.draw.rect(surface, border_color, button["rect"], 2, border_radius=10)
+    surface.blit(*button["label"])
+
 def main_menu(screen, clock, font, small_font):
     """
     Displays the main menu for Pong.
@@ -52,54 +90,75 @@ def main_menu(screen, clock, font, small_font):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    # Main loop for the menu.
+    # The layout is static, so the button rects and labels are built once before the loop.
+    button_width = 250
+    button_height = 60
+    button_spacing = 20
+
+    settings_y = SCREEN_HEIGHT / 2 - 50
+    start_y = settings_y + button_height + button_spacing
+    quit_y = start_y + button_height + button_spacing
+
+    settings_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, settings_y, button_width, button_height)
+    start_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, start_y, button_width, button_height)
+    quit_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, quit_y, button_width, button_height)
+
+    buttons = [
+        {"text": "Settings", "rect": settings_button_rect, "action": "settings"},
+        {"text": "Start Game", "rect": start_button_rect, "action": "play"},
+        {"text": "Back to Menu", "rect": quit_button_rect, "action": "quit"}
+    ]
+    for button in buttons:
+        button["label"] = render_text(button["text"], small_font, TEXT_COLOR, button["rect"].centerx, button["rect"].centery)
+
+    # Everything but the hover highlight is static, so the screen is composed once.
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    background.fill(BACKGROUND_COLOR)
+    draw_text("Pong", font, HIGHLIGHT_COLOR, background, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 4)
+    for button in buttons:
+        draw_button(background, button, BUTTON_COLOR, BORDER_COLOR)
+
+    # Main loop for the menu. It only repaints after an event arrives; a hover change
+    # alone repaints just the affected buttons and pushes only their rects to the display.
+    dirty = True
+    hovered = None
     while True:
-        screen.fill(BACKGROUND_COLOR)
-        draw_text("Pong", font, HIGHLIGHT_COLOR, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 4)
-
-        mx, my = pygame.mouse.get_pos()
-
-        # Define button properties.
-        button_width = 250
-        button_height = 60
-        button_spacing = 20
-
-        settings_y = SCREEN_HEIGHT / 2 - 50
-        start_y = settings_y + button_height + button_spacing
-        quit_y = start_y + button_height + button_spacing
-
-        settings_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, settings_y, button_width, button_height)
-        start_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, start_y, button_width, button_height)
-        quit_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, quit_y, button_width, button_height)
-
-        buttons = [
-            {"text": "Settings", "rect": settings_button_rect, "action": "settings"},
-            {"text": "Start Game", "rect": start_button_rect, "action": "play"},
-            {"text": "Back to Menu", "rect": quit_button_rect, "action": "quit"}
-        ]
+        if dirty:
+            screen.blit(background, (0, 0))
+            hovered = find_hovered(buttons, pygame.mouse.get_pos())
+            if hovered:
+                draw_button(screen, hovered, BUTTON_HOVER_COLOR, BORDER_COLOR)
+            pygame.display.flip()
+            dirty = False
 
         # Event handling for the menu.
-        for event in pygame.event.get():
+        # Sleep until input arrives instead of redrawing at a fixed rate; the timeout keeps the loop responsive.
+        for event in [pygame.event.wait(33)] + pygame.event.get(MENU_EVENTS):
             if event.type == pygame.QUIT:
                 return 'quit'
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEMOTION:
+                new_hovered = find_hovered(buttons, event.pos)
+                if new_hovered is not hovered:
+                    changed = []
+                    if hovered:
+                        screen.blit(background, hovered["rect"], hovered["rect"])
+                        changed.append(hovered["rect"])
+                    if new_hovered:
+                        draw_button(screen, new_hovered, BUTTON_HOVER_COLOR, BORDER_COLOR)
+                        changed.append(new_hovered["rect"])
+                    hovered = new_hovered
+                    pygame.display.update(changed)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
                 for button in buttons:
                     if button["rect"].collidepoint(event.pos):
                         if button["action"] == "settings":
                             new_volume, status = settings_menu(screen, clock, SCREEN_WIDTH, SCREEN_HEIGHT, pygame.mixer.music.get_volume())
                             if status == 'quit': return 'quit'
+                            dirty = True
                         else:
                             return button["action"]
-
-        # Draw buttons with hover effects.
-        for button in buttons:
-            current_button_color = BUTTON_HOVER_COLOR if button["rect"].collidepoint(mx, my) else BUTTON_COLOR
-            pygame.draw.rect(screen, current_button_color, button["rect"], border_radius=10)
-            pygame.draw.rect(screen, BORDER_COLOR, button["rect"], 2, border_radius=10)
-            draw_text(button["text"], small_font, TEXT_COLOR, screen, button["rect"].centerx, button["rect"].centery)
-
-        pygame.display.flip()
-        clock.tick(15)
+            elif event.type == pygame.WINDOWEXPOSED:
+                dirty = True
 
 def draw_retro_background(screen):
     """Draws a retro-style holographic grid background."""
@@ -113,6 +172,51 @@ def draw_retro_background(screen):
     # Center line
     pygame.draw.line(screen, (100, 100, 100), (SCREEN_WIDTH // 2, 0), (SCREEN_WIDTH // 2, SCREEN_HEIGHT), 2)
 
+# The background never changes, so it is drawn once and blitted every frame.
+_BG_CACHE = None
+
+def get_background():
+    """
+    Returns the retro background, drawing it on first use. Must be called after a display mode is set.
+
+    Returns:
+        pygame.Surface: The background, in the display's pixel format.
+    """
+    global _BG_CACHE
+    if _BG_CACHE is None:
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        draw_retro_background(background)
+        _BG_CACHE = background.convert()
+    return _BG_CACHE
+
+# The ball trail is the ball's last TRAIL_LENGTH centres, newest first. Trail dots never move and
+# all shrink at the same rate, so their radius depends only on their age and is looked up here.
+TRAIL_LENGTH = 10
+TRAIL_COLOR = (200, 200, 0)
+TRAIL_RADII = tuple(int(3 - 0.1 * age) for age in range(TRAIL_LENGTH))
+
+def draw_trail(screen, trail, offset):
+    """Draws the ball trail shifted by `offset`."""
+    ox, oy = offset
+    circle = pygame.draw.circle
+    for (x, y), radius in zip(trail, TRAIL_RADII):
+        circle(screen, TRAIL_COLOR, (x + ox, y + oy), radius)
+
+# Burnt-out explosion particles, reused by the next paddle hit.
+particle_pool = []
+
+def draw_particles(screen, particles, offset):
+    """Draws every live particle shifted by `offset`."""
+    ox, oy = offset
+    circle = pygame.draw.circle
+    for p in particles:
+        if p.life > 0 and p.size > 0:
+            circle(screen, p.color, (int(p.x) + ox, int(p.y) + oy), int(p.size))
+
+def random_sign():
+    """Returns 1 or -1 with equal odds, from a single random bit."""
+    return (random.getrandbits(1) << 1) - 1
+
 def game_loop(screen, clock, font, sounds):
     """
     Runs the main game loop for Pong.
@@ -132,17 +236,38 @@ def game_loop(screen, clock, font, sounds):
     ball = pygame.Rect(SCREEN_WIDTH / 2 - BALL_SIZE / 2, SCREEN_HEIGHT / 2 - BALL_SIZE / 2, BALL_SIZE, BALL_SIZE)
 
     # Initialize ball speed.
-    ball_speed_x = 7 * random.choice((1, -1))
-    ball_speed_y = 7 * random.choice((1, -1))
+    ball_speed_x = 7 * random_sign()
+    ball_speed_y = 7 * random_sign()
 
     # Initialize scores.
     player_score, ai_score = 0, 0
+    # Scores only ever run from 0 to WINNING_SCORE, so every one is rendered up front.
+    score_digits = [font.render(str(i), True, WHITE).convert_alpha() for i in range(WINNING_SCORE + 1)]
+
+    background = get_background()
+    # The paddles and ball never change shape, so they are drawn once and blitted every frame.
+    paddle_surface = pygame.Surface((PADDLE_WIDTH, PADDLE_HEIGHT)).convert()
+    paddle_surface.fill((200, 200, 200))
+    ball_surface = pygame.Surface((BALL_SIZE, BALL_SIZE)).convert()
+    ball_surface.fill(BLACK)
+    ball_surface.set_colorkey(BLACK)
+    pygame.draw.ellipse(ball_surface, (255, 255, 0), ball_surface.get_rect())
+
+    # The hit flash is a solid white overlay whose surface alpha is set per frame, so it is made once.
+    flash_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    flash_surface.fill(WHITE)
 
     # Effects
     particles = []
+    trail = deque(maxlen=TRAIL_LENGTH)
     screen_shaker = None
     hit_flash = 0
 
+    # The arrow keys are tracked from key events instead of polling the keyboard every frame.
+    # The keyboard is only read when events may have been missed: on entry and after a pause.
+    keys = pygame.key.get_pressed()
+    up_held, down_held = keys[pygame.K_UP], keys[pygame.K_DOWN]
+
     # Main game loop.
     running = True
     while running:
@@ -150,52 +275,64 @@ def game_loop(screen, clock, font, sounds):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return 'quit', player_score
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
-                # Pause the game.
-                pause_choice = pause_menu(screen, clock, SCREEN_WIDTH, SCREEN_HEIGHT)
-                if pause_choice == 'quit':
-                    return player_score, 'quit'
+            if event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
+                if event.key == pygame.K_UP:
+                    up_held = event.type == pygame.KEYDOWN
+                elif event.key == pygame.K_DOWN:
+                    down_held = event.type == pygame.KEYDOWN
+                elif event.key == pygame.K_p and event.type == pygame.KEYDOWN:
+                    # Pause the game.
+                    pause_choice = pause_menu(screen, clock, SCREEN_WIDTH, SCREEN_HEIGHT)
+                    if pause_choice == 'quit':
+                        return player_score, 'quit'
+                    keys = pygame.key.get_pressed()
+                    up_held, down_held = keys[pygame.K_UP], keys[pygame.K_DOWN]
 
         # Player movement.
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_UP]:
-            player_paddle.y -= PADDLE_SPEED
-        if keys[pygame.K_DOWN]:
-            player_paddle.y += PADDLE_SPEED
+        player_paddle.y += (down_held - up_held) * PADDLE_SPEED
 
         # Keep player paddle on the screen.
         player_paddle.y = max(0, min(player_paddle.y, SCREEN_HEIGHT - PADDLE_HEIGHT))
 
-        # Ball movement.
+        # Ball movement. A ball that would pass through the top or bottom wall is reflected off it
+        # by the distance it overshot, so it never ends a frame inside the wall.
         ball.x += ball_speed_x
-        ball.y += ball_speed_y
-
-        # Ball collision with top and bottom walls.
-        if ball.top <= 0 or ball.bottom >= SCREEN_HEIGHT:
+        ball_y = ball.y + ball_speed_y
+        if ball_y < 0:
+            ball_y = -ball_y
+            ball_speed_y = -ball_speed_y
+            sounds['wall_hit'].play()
+        elif ball_y > SCREEN_HEIGHT - BALL_SIZE:
+            ball_y = 2 * (SCREEN_HEIGHT - BALL_SIZE) - ball_y
+            ball_speed_y = -ball_speed_y
             sounds['wall_hit'].play()
-            ball_speed_y *= -1
+        ball.y = ball_y
 
-        # Ball collision with paddles.
-        if ball.colliderect(player_paddle) or ball.colliderect(ai_paddle):
+        # Ball collision with paddles. Only the paddle the ball is heading towards is tested, and only
+        # once the ball has reached it; this also stops a ball still overlapping a paddle after a
+        # bounce from being turned back into it on the next frame.
+        if ((ball_speed_x < 0 and ball.left < player_paddle.right and ball.colliderect(player_paddle))
+                or (ball_speed_x > 0 and ball.right > ai_paddle.left and ball.colliderect(ai_paddle))):
             sounds['paddle_hit'].play()
-            ball_speed_x *= -1.1  # Increase speed on hit.
-            ball_speed_y *= 1.1
+            # Increase speed on hit, up to MAX_BALL_SPEED.
+            ball_speed_x = max(-MAX_BALL_SPEED, min(ball_speed_x * -1.1, MAX_BALL_SPEED))
+            ball_speed_y = max(-MAX_BALL_SPEED, min(ball_speed_y * 1.1, MAX_BALL_SPEED))
             hit_flash = 10
-            create_explosion(particles, ball.centerx, ball.centery, (255, 255, 0))
+            create_explosion(particles, ball.centerx, ball.centery, (255, 255, 0), pool=particle_pool)
 
         # Scoring.
         if ball.left <= 0:
             ai_score += 1
             ball.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-            ball_speed_x = 7 * random.choice((1, -1))
-            ball_speed_y = 7 * random.choice((1, -1))
+            ball_speed_x = 7 * random_sign()
+            ball_speed_y = 7 * random_sign()
             sounds['score_point'].play()
             screen_shaker = ScreenShaker(intensity=5, duration=15)
         if ball.right >= SCREEN_WIDTH:
             player_score += 1
             ball.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-            ball_speed_x = 7 * random.choice((1, -1))
-            ball_speed_y = 7 * random.choice((1, -1))
+            ball_speed_x = 7 * random_sign()
+            ball_speed_y = 7 * random_sign()
             sounds['score_point'].play()
             screen_shaker = ScreenShaker(intensity=5, duration=15)
 
@@ -207,10 +344,8 @@ def game_loop(screen, clock, font, sounds):
         ai_paddle.y = max(0, min(ai_paddle.y, SCREEN_HEIGHT - PADDLE_HEIGHT))
 
         # Update particles
-        for p in particles:
-            p.update()
-        particles = [p for p in particles if p.life > 0]
-        particles.append(Particle(ball.centerx, ball.centery, (200, 200, 0), 3, 10, 0, 0))
+        update_particles(particles, particle_pool)
+        trail.appendleft(ball.center)
 
         # --- Drawing ---
         screen_offset = (0, 0)
@@ -219,27 +354,34 @@ def game_loop(screen, clock, font, sounds):
             if screen_shaker.timer >= screen_shaker.duration:
                 screen_shaker = None
         
-        temp_surface = screen.copy()
-        draw_retro_background(temp_surface)
-        
-        pygame.draw.rect(temp_surface, (200, 200, 200), player_paddle)
-        pygame.draw.rect(temp_surface, (200, 200, 200), ai_paddle)
-        pygame.draw.ellipse(temp_surface, (255, 255, 0), ball)
+        # Everything is drawn straight onto the screen, shifted by the shake offset. The clip keeps
+        # drawing inside the shifted frame, so the strip it uncovers keeps the previous frame.
+        ox, oy = screen_offset
+        screen.set_clip((ox, oy, SCREEN_WIDTH, SCREEN_HEIGHT))
+        screen.blit(background, screen_offset)
 
-        for p in particles:
-            p.draw(temp_surface)
+        screen.blits([
+            (paddle_surface, player_paddle.move(screen_offset)),
+            (paddle_surface, ai_paddle.move(screen_offset)),
+            (ball_surface, ball.move(screen_offset)),
+        ], False)
 
-        draw_text(str(player_score), font, WHITE, temp_surface, SCREEN_WIDTH / 4, 50)
-        draw_text(str(ai_score), font, WHITE, temp_surface, SCREEN_WIDTH * 3 / 4, 50)
+        draw_trail(screen, trail, screen_offset)
+        draw_particles(screen, particles, screen_offset)
+
+        player_digit, ai_digit = score_digits[player_score], score_digits[ai_score]
+        screen.blit(player_digit, player_digit.get_rect(center=(SCREEN_WIDTH // 4 + ox, 50 + oy)))
+        screen.blit(ai_digit, ai_digit.get_rect(center=(SCREEN_WIDTH * 3 // 4 + ox, 50 + oy)))
 
         if hit_flash > 0:
-            flash_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            flash_surface.fill((255, 255, 255, hit_flash * 20))
-            temp_surface.blit(flash_surface, (0, 0))
+            flash_surface.set_alpha(hit_flash * 20)
+            screen.blit(flash_surface, screen_offset)
             hit_flash -= 1
 
-        screen.blit(temp_surface, screen_offset)
+        screen.set_clip(None)
         pygame.display.flip()
+        # Movement is per frame, so the 60 FPS cap stays even with vsync; on a faster
+        # display an uncapped loop would speed the game up.
         clock.tick(60)
 
         # Check for a winner.
@@ -271,50 +413,97 @@ def end_screen(screen, clock, font, small_font, message):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    title_font = pygame.font.Font(None, 60)
-    button_font = pygame.font.Font(None, 40)
-
-    # Main loop for the end screen.
+    title_font = get_font(60)
+    button_font = get_font(40)
+
+    # The layout is static, so the button rects and labels are built once before the loop.
+    button_width = 250
+    button_height = 60
+    button_spacing = 20
+
+    play_again_y = SCREEN_HEIGHT / 2 + 20
+    quit_y = play_again_y + button_height + button_spacing
+
+    play_again_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, play_again_y, button_width, button_height)
+    quit_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, quit_y, button_width, button_height)
+
+    buttons = [
+        {"text": "Play Again", "rect": play_again_button_rect, "action": "play_again"},
+        {"text": "Back to Menu", "rect": quit_button_rect, "action": "quit"}
+    ]
+    for button in buttons:
+        button["label"] = render_text(button["text"], button_font, TEXT_COLOR, button["rect"].centerx, button["rect"].centery)
+
+    # Everything but the hover highlight is static, so the screen is composed once.
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    background.fill(BACKGROUND_COLOR)
+    draw_text(message, title_font, HIGHLIGHT_COLOR, background, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3)
+    for button in buttons:
+        draw_button(background, button, BUTTON_COLOR, BORDER_COLOR)
+
+    # Main loop for the end screen. It only repaints after an event arrives; a hover change
+    # alone repaints just the affected buttons and pushes only their rects to the display.
+    dirty = True
+    hovered = None
     while True:
-        screen.fill(BACKGROUND_COLOR)
-        draw_text(message, title_font, HIGHLIGHT_COLOR, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3)
-
-        mx, my = pygame.mouse.get_pos()
-
-        # Define button properties.
-        button_width = 250
-        button_height = 60
-        button_spacing = 20
-
-        play_again_y = SCREEN_HEIGHT / 2 + 20
-        quit_y = play_again_y + button_height + button_spacing
-
-        play_again_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, play_again_y, button_width, button_height)
-        quit_button_rect = pygame.Rect(SCREEN_WIDTH / 2 - button_width / 2, quit_y, button_width, button_height)
-
-        buttons = [
-            {"text": "Play Again", "rect": play_again_button_rect, "action": "play_again"},
-            {"text": "Back to Menu", "rect": quit_button_rect, "action": "quit"}
-        ]
+        if dirty:
+            screen.blit(background, (0, 0))
+            hovered = find_hovered(buttons, pygame.mouse.get_pos())
+            if hovered:
+                draw_button(screen, hovered, BUTTON_HOVER_COLOR, BORDER_COLOR)
+            pygame.display.flip()
+            dirty = False
 
         # Event handling for the end screen.
-        for event in pygame.event.get():
+        # Sleep until input arrives instead of redrawing at a fixed rate; the timeout keeps the loop responsive.
+        for event in [pygame.event.wait(33)] + pygame.event.get(MENU_EVENTS):
             if event.type == pygame.QUIT:
                 return 'quit'
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEMOTION:
+                new_hovered = find_hovered(buttons, event.pos)
+                if new_hovered is not hovered:
+                    changed = []
+                    if hovered:
+                        screen.blit(background, hovered["rect"], hovered["rect"])
+                        changed.append(hovered["rect"])
+                    if new_hovered:
+                        draw_button(screen, new_hovered, BUTTON_HOVER_COLOR, BORDER_COLOR)
+                        changed.append(new_hovered["rect"])
+                    hovered = new_hovered
+                    pygame.display.update(changed)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
                 for button in buttons:
                     if button["rect"].collidepoint(event.pos):
                         return button["action"]
+            elif event.type == pygame.WINDOWEXPOSED:
+                dirty = True
 
-        # Draw buttons with hover effects.
-        for button in buttons:
-            current_button_color = BUTTON_HOVER_COLOR if button["rect"].collidepoint(mx, my) else BUTTON_COLOR
-            pygame.draw.rect(screen, current_button_color, button["rect"], border_radius=10)
-            pygame.draw.rect(screen, BORDER_COLOR, button["rect"], 2, border_radius=10)
-            draw_text(button["text"], button_font, TEXT_COLOR, screen, button["rect"].centerx, button["rect"].centery)
+# --- Sounds ---
+# Loaded sounds are kept for the life of the process, so returning to Pong from the launcher
+# does not read the files from disk again.
+_SOUND_CACHE = {}
 
-        pygame.display.flip()
-        clock.tick(15)
+class DummySound:
+    """Stands in for a sound that could not be loaded, so the game runs silently."""
+    def play(self): pass
+
+def _get_sound(path):
+    """
+    Returns the sound at `path`, loading it on first use.
+
+    Args:
+        path (str): The path of the sound file.
+
+    Returns:
+        pygame.mixer.Sound: The sound, or a DummySound if it could not be loaded.
+    """
+    if path not in _SOUND_CACHE:
+        try:
+            _SOUND_CACHE[path] = pygame.mixer.Sound(path)
+        except pygame.error:
+            print("Could not load sound for Pong. Game will be silent.")
+            _SOUND_CACHE[path] = DummySound()
+    return _SOUND_CACHE[path]
 
 def run_game(screen, clock):
     """
@@ -325,19 +514,12 @@ def run_game(screen, clock):
         clock (pygame.time.Clock): The Pygame clock object.
     """
     pygame.display.set_caption("Pong")
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 36)
+    font = get_font(74)
+    small_font = get_font(36)
 
-    # Load sounds with error handling.
-    try:
-        hit_sound = pygame.mixer.Sound('assets/sounds/wall_hit.wav')
-        sounds = {'paddle_hit': hit_sound, 'wall_hit': hit_sound, 'score_point': hit_sound}
-    except pygame.error:
-        print("Could not load sound for Pong. Game will be silent.")
-        # Create dummy sound objects if loading fails.
-        class DummySound:
-            def play(self): pass
-        sounds = {'paddle_hit': DummySound(), 'wall_hit': DummySound(), 'score_point': DummySound()}
+    # Every effect currently shares the one hit sound.
+    hit_sound = _get_sound('assets/sounds/wall_hit.wav')
+    sounds = {'paddle_hit': hit_sound, 'wall_hit': hit_sound, 'score_point': hit_sound}
 
     # Main state machine loop.
     while True:
@@ -345,7 +527,14 @@ def run_game(screen, clock):
         if menu_choice == 'quit':
             return 0
 
-        winner_message, final_score = game_loop(screen, clock, font, sounds)
+        # The game only reacts to the keyboard, so keep mouse motion and focus changes out of the
+        # queue while it runs. The previous setting is restored for the menus afterwards.
+        previously_blocked = [event_type for event_type in GAME_IGNORED_EVENTS if pygame.event.get_blocked(event_type)]
+        pygame.event.set_blocked(GAME_IGNORED_EVENTS)
+        try:
+            winner_message, final_score = game_loop(screen, clock, font, sounds)
+        finally:
+            pygame.event.set_allowed([event_type for event_type in GAME_IGNORED_EVENTS if event_type not in previously_blocked])
         scores.save_score("Pong", final_score)
         if winner_message == 'quit':
             return final_score
@@ -357,7 +546,7 @@ def run_game(screen, clock):
 if __name__ == "__main__":
     # This block runs when the script is executed directly.
     pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = set_game_mode()
     clock = pygame.time.Clock()
     run_game(screen, clock)
     pygame.quit()
@@ -10,14 +10,11 @@ import os
 # The name of the file where high scores are stored.
 SCORE_FILE = "high_scores.json"
 
-def load_scores():
-    """
-    Loads scores from the JSON file.
+# The scores are read from disk once per process and kept here; this module is the only writer.
+_CACHE = None
 
-    Returns:
-        dict: A dictionary containing the high scores, with game names as keys.
-              Returns an empty dictionary if the file doesn't exist or is invalid.
-    """
+def _load_from_disk():
+    """Reads the score file, returning an empty dictionary if it doesn't exist or is invalid."""
     if not os.path.exists(SCORE_FILE):
         return {}
     try:
@@ -27,6 +24,20 @@ def load_scores():
         # Handle cases where the file is empty or corrupted.
         return {}
 
+def load_scores():
+    """
+    Loads scores from the JSON file, reading it only on first use.
+
+    Returns:
+        dict: A dictionary containing the high scores, with game names as keys.
+              Returns an empty dictionary if the file doesn't exist or is invalid.
+              The dictionary is shared, so callers must not modify it.
+    """
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = _load_from_disk()
+    return _CACHE
+
 def save_score(game_name, new_score):
     """
     Saves a new score if it's higher than the existing one for that game.
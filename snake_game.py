@@ -12,7 +12,7 @@ import random
 
 # Import shared modules and constants.
 from config import BLACK, WHITE, GREEN, RED, GRAY, DEFAULT_MUSIC_VOLUME
-from utils import draw_text, pause_menu, settings_menu, Particle, create_explosion
+from utils import draw_text, pause_menu, settings_menu, Particle, create_explosion, get_font
 import scores
 
 # --- Initialization ---
@@ -327,8 +327,8 @@ def run_game(screen, clock):
     pygame.display.set_caption("Snake Game")
     # Resize the screen for this game.
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    font = pygame.font.Font(None, 60)
-    small_font = pygame.font.Font(None, 36)
+    font = get_font(60)
+    small_font = get_font(36)
 
     # Initialize game state variables.
     game_state = START_MENU
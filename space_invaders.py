@@ -11,7 +11,7 @@ import random
 
 # Import shared modules and constants.
 from config import BLACK, WHITE, GREEN, RED
-from utils import draw_text, pause_menu, settings_menu, create_explosion
+from utils import draw_text, pause_menu, settings_menu, create_explosion, get_font
 import scores
 
 # --- Initialization ---
@@ -140,7 +140,7 @@ def draw_starfield(screen, stars):
 
 def game_loop(screen, clock, font, level, total_score=0):
     pygame.display.set_caption(f"Space Invaders - Level {level}")
-    font = pygame.font.Font(None, 36)
+    font = get_font(36)
 
     # Adjust alien properties based on level
     current_alien_speed_x = ALIEN_SPEED_X + (level - 1) * 0.5
@@ -292,7 +292,7 @@ def end_screen(screen, clock, font, message):
     """
     while True:
         screen.fill(BLACK)
-        draw_text(message, pygame.font.Font(None, 50), WHITE, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3)
+        draw_text(message, get_font(50), WHITE, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3)
         play_again_button = draw_text("Play Again", font, WHITE, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
         quit_button = draw_text("Back to Menu", font, WHITE, screen, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 50)
 
@@ -326,9 +326,9 @@ def congratulations_screen(screen, clock, font, final_score):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    title_font = pygame.font.Font(None, 70)
-    score_font = pygame.font.Font(None, 50)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(70)
+    score_font = get_font(50)
+    button_font = get_font(40)
 
     while True:
         screen.fill(BACKGROUND_COLOR)
@@ -380,8 +380,8 @@ def run_game(screen, clock):
     Returns:
         int: The final score of the player.
     """
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 36)
+    font = get_font(74)
+    small_font = get_font(36)
 
     # Game loop for levels
     while True:
@@ -4,7 +4,7 @@ import random
 
 # Import shared modules and constants.
 from config import BLACK, WHITE, GRAY, DEFAULT_MUSIC_VOLUME, GREEN, RED, YELLOW
-from utils import draw_text, pause_menu, settings_menu, create_explosion
+from utils import draw_text, pause_menu, settings_menu, create_explosion, get_font
 import scores
 
 
@@ -93,8 +93,8 @@ def end_screen(screen, clock, font, message):
     BUTTON_HOVER_COLOR = (80, 80, 80)
     BORDER_COLOR = (150, 150, 150)
 
-    title_font = pygame.font.Font(None, 60)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(60)
+    button_font = get_font(40)
 
     while True:
         screen.fill(BACKGROUND_COLOR)
@@ -139,9 +139,9 @@ def run_game(screen, clock):
     Main function to manage the game states for Tetris.
     """
     pygame.display.set_caption("Tetris")
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 36)
-    game_over_font = pygame.font.Font(None, 50)
+    font = get_font(74)
+    small_font = get_font(36)
+    game_over_font = get_font(50)
     particles = []
 
     while True:
@@ -8,7 +8,7 @@ player turns, and win/tie conditions. It also features a main menu and an end sc
 import pygame
 import sys
 from config import BLACK, WHITE, GREEN, RED, GRAY
-from utils import draw_text, pause_menu, settings_menu
+from utils import draw_text, pause_menu, settings_menu, get_font
 
 # --- Constants ---
 SCREEN_WIDTH, SCREEN_HEIGHT = 600, 600
@@ -34,9 +34,9 @@ class TicTacToeGame:
     def __init__(self, screen, clock):
         self.screen = screen
         self.clock = clock
-        self.font = pygame.font.Font(None, 40)
-        self.title_font = pygame.font.Font(None, 80)
-        self.small_font = pygame.font.Font(None, 36)
+        self.font = get_font(40)
+        self.title_font = get_font(80)
+        self.small_font = get_font(36)
         self.board = [[None for _ in range(BOARD_COLS)] for _ in range(BOARD_ROWS)]
         self.player = 'X'
         self.game_over = False
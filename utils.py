@@ -5,12 +5,18 @@ This module contains functions that are used by multiple games, such as drawing
 - handling menus (pause, settings), and screen transitions.
 """
 
+import functools
 import pygame
 import random
 
 # --- Particle System ---
 class Particle:
+    __slots__ = ('x', 'y', 'color', 'size', 'life', 'dx', 'dy')
+
     def __init__(self, x, y, color, size, life, dx, dy):
+        self.reset(x, y, color, size, life, dx, dy)
+
+    def reset(self, x, y, color, size, life, dx, dy):
         self.x = x
         self.y = y
         self.color = color
@@ -30,13 +36,83 @@ class Particle:
         if self.life > 0 and self.size > 0:
             pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), int(self.size))
 
-def create_explosion(particles, x, y, color, count=20):
+def create_explosion(particles, x, y, color, count=20, pool=None):
+    """Adds `count` particles to `particles`, reusing dead ones from `pool` when given."""
     for _ in range(count):
         dx = random.uniform(-4, 4)
         dy = random.uniform(-4, 4)
         size = random.uniform(2, 6)
         life = random.randint(20, 40)
-        particles.append(Particle(x, y, color, size, life, dx, dy))
+        if pool:
+            particle = pool.pop()
+            particle.reset(x, y, color, size, life, dx, dy)
+        else:
+            particle = Particle(x, y, color, size, life, dx, dy)
+        particles.append(particle)
+
+def update_particles(particles, pool):
+    """
+    Advances every particle and moves burnt-out ones to `pool`, compacting `particles` in place.
+
+    This is the same step as Particle.update, inlined so the hot loop makes no method call per
+    particle. A particle that burns out goes straight to the pool without being moved.
+    """
+    write = 0
+    pool_append = pool.append
+    for particle in particles:
+        life = particle.life - 1
+        if life > 0:
+            particle.life = life
+            particle.x += particle.dx
+            particle.y += particle.dy
+            if particle.size > 0:
+                particle.size -= 0.1
+            particles[write] = particle
+            write += 1
+        else:
+            pool_append(particle)
+    del particles[write:]
+
+# Particle circles are pre-rendered once per (color, radius), so games can draw them with a batched blits().
+_PARTICLE_SPRITES = {}
+
+def get_particle_sprite(color, radius):
+    """
+    Returns a circle of the given color and radius, rendering it on first use.
+
+    Args:
+        color (tuple): The circle's color.
+        radius (int): The circle's radius in pixels.
+
+    Returns:
+        pygame.Surface: The circle, centred on a (2 * radius + 1) square surface.
+    """
+    key = (color, radius)
+    sprite = _PARTICLE_SPRITES.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        sprite = _PARTICLE_SPRITES[key] = sprite.convert_alpha()
+    return sprite
+
+# --- Fonts ---
+# Fonts are opened once per size and shared, so menus entered repeatedly skip reloading the font file.
+_FONT_CACHE = {}
+
+def get_font(size):
+    """
+    Returns the default font at the given size, creating it on first use.
+
+    Args:
+        size (int): The font size in pixels.
+
+    Returns:
+        pygame.font.Font: The shared font object for that size.
+    """
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
 
 # --- Screen Shake ---
 class ScreenShaker:
@@ -53,6 +129,14 @@ class ScreenShaker:
             return (offset_x, offset_y)
         return (0, 0)
 
+# Recently drawn strings keep their rendered surface, so text redrawn every frame with the
+# same value skips glyph rasterization. The font itself is part of the key, which also keeps
+# it alive so a key can never match a different font. Callers open their fonts through get_font,
+# so the same few shared fonts keep hitting instead of every new Font adding dead entries.
+@functools.lru_cache(maxsize=256)
+def _render_cached(text, font, color):
+    return font.render(text, True, color)
+
 def draw_text(text, font, color, surface, x, y, center=True):
     """
     Helper function to draw text on a surface.
@@ -69,7 +153,7 @@ def draw_text(text, font, color, surface, x, y, center=True):
     Returns:
         pygame.Rect: The rectangle enclosing the drawn text.
     """
-    textobj = font.render(text, 1, color)
+    textobj = _render_cached(text, font, tuple(color))
     textrect = textobj.get_rect()
     if center:
         textrect.center = (x, y)
@@ -78,6 +162,31 @@ def draw_text(text, font, color, surface, x, y, center=True):
     surface.blit(textobj, textrect)
     return textrect
 
+def render_text(text, font, color, x, y, background=None):
+    """
+    Renders centered text once so it can be blitted every frame without re-rendering.
+
+    The surface is converted to the display's pixel format, so a display mode must already be set.
+    Text that always sits on one solid color can pass it as `background` to get an opaque
+    surface, which blits without per-pixel alpha blending.
+
+    Args:
+        text (str): The text to render.
+        font (pygame.font.Font): The font to use.
+        color (tuple): The color of the text.
+        x (int): The x-coordinate of the text center.
+        y (int): The y-coordinate of the text center.
+        background (tuple, optional): A solid color to render the text onto. Defaults to None (transparent).
+
+    Returns:
+        tuple: The rendered (pygame.Surface, pygame.Rect) pair, ready for `surface.blit(*pair)`.
+    """
+    if background is None:
+        textobj = font.render(text, True, color).convert_alpha()
+    else:
+        textobj = font.render(text, True, color, background).convert()
+    return textobj, textobj.get_rect(center=(x, y))
+
 
 def fade_transition(screen, clock, fade_out=True, duration=500):
     """
@@ -91,6 +200,8 @@ def fade_transition(screen, clock, fade_out=True, duration=500):
     """
     start_time = pygame.time.get_ticks()
     original_surface = screen.copy()
+    # A solid black surface with surface-wide alpha blends faster than a per-pixel alpha one.
+    fade_surface = pygame.Surface(screen.get_size()).convert()
 
     while True:
         elapsed_time = pygame.time.get_ticks() - start_time
@@ -103,8 +214,7 @@ def fade_transition(screen, clock, fade_out=True, duration=500):
         if alpha > 255: alpha = 255
 
         screen.blit(original_surface, (0, 0))
-        fade_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        fade_surface.fill((0, 0, 0, alpha))
+        fade_surface.set_alpha(alpha)
         screen.blit(fade_surface, (0, 0))
         pygame.display.flip()
 
@@ -125,13 +235,13 @@ def pause_menu(screen, clock, game_width, game_height):
     Returns:
         str: The action selected by the user ('resume' or 'quit').
     """
-    overlay = pygame.Surface((game_width, game_height), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
+    overlay = pygame.Surface((game_width, game_height)).convert()
+    overlay.set_alpha(200)
     screen.blit(overlay, (0, 0))
 
     # Fonts and colors for the pause menu.
-    title_font = pygame.font.Font(None, 80)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(80)
+    button_font = get_font(40)
     TEXT_COLOR = (255, 255, 255)
     BUTTON_COLOR = (50, 50, 50)
     BUTTON_HOVER_COLOR = (80, 80, 80)
@@ -200,13 +310,13 @@ def settings_menu(screen, clock, game_width, game_height, initial_volume):
     Returns:
         tuple: A tuple containing the new volume and a status ('resume' or 'quit').
     """
-    overlay = pygame.Surface((game_width, game_height), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
+    overlay = pygame.Surface((game_width, game_height)).convert()
+    overlay.set_alpha(200)
 
     # Fonts and colors for the settings menu.
-    title_font = pygame.font.Font(None, 80)
-    label_font = pygame.font.Font(None, 40)
-    button_font = pygame.font.Font(None, 40)
+    title_font = get_font(80)
+    label_font = get_font(40)
+    button_font = get_font(40)
     TEXT_COLOR = (255, 255, 255)
     BUTTON_COLOR = (50, 50, 50)
     BUTTON_HOVER_COLOR = (80, 80, 80)